@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from crawl import parse_args
+from delta import file_hash
+from engine import CRAWLERS, close_shards, run
+from instrument import METRICS
+
+# ==========================================
+# 🗓️ 여러 학교 × 여러 학기 한 번에 (배치)
+# ==========================================
+# 작업 = (학교, 연도, 학기). 학교마다 프로세스 하나를 두고 그 안에서 학기를 차례로 돌리며
+# 같은 브라우저(로그인/포털 화면)와 병렬 워커(헤드리스 크롬)를 그대로 넘겨 씀 → 학기 바꿀 땐 드롭다운만 다시 선택.
+# 동시 실행 수는 --budget 하나로 나눠 가짐 (합이 budget 을 넘지 않음):
+#   학교마다 1 은 기본, 남은 예산은 병렬이 되는 학교들이 똑같이 나눠서 --workers 로 (한양대 페이지 넘기기, 브라우저 모드 고려대는 1 그대로)
+#   학교 수가 budget 보다 많으면 학교마다 1 이고 동시에 도는 학교를 budget 개로 제한
+# 학기마다 real_lectures_{학교}_{연도}_{학기}.json 을 따로 쓰고, 끝나면 manifest.json 에 행 수/해시를 기록합니다.
+#
+#   python batch.py KOREA:2025:1 KOREA:2025:2 HANYANG:2025:1 --out-dir out
+#   python batch.py --jobs jobs.json --budget 8 -- --http --validate
+#       jobs.json: [{"university": "KOREA", "year": 2025, "semester": 2, "args": ["--endpoint", "korea.json"]}, ...]
+#   (-- 뒤는 모든 작업에 공통으로 붙는 crawl.py 옵션)
+
+MANIFEST_FILE = "manifest.json"
+
+def parse_job(text):
+    try:
+        university, year, semester = text.split(":")
+        return {"university": university.upper(), "year": int(year), "semester": int(semester)}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"작업은 학교:연도:학기 형식이어야 합니다: {text}")
+
+def load_jobs(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [{**job, "university": job["university"].upper()} for job in json.load(f)]
+
+def term_file(out_dir, job):
+    return os.path.join(out_dir, f"real_lectures_{job['university'].lower()}_{job['year']}_{job['semester']}.json")
+
+# 병렬로 돌 수 있는 학교인지 (순서대로만 도는 학교 X, 세션을 옮길 수 없는 학교는 --http/--clone-session 일 때만)
+def can_parallel(name, common=()):
+    cls = CRAWLERS[name]
+    return not cls.sequential and (cls.clone_session or "--http" in common or "--clone-session" in common)
+
+# 학교별 --workers
+def plan_workers(universities, budget, common=()):
+    plan = {name: 1 for name in universities}
+    parallel = [name for name in universities if can_parallel(name, common)]
+    spare = budget - len(universities)
+    if parallel and spare > 0:
+        for index, name in enumerate(parallel):
+            plan[name] += spare // len(parallel) + (1 if index < spare % len(parallel) else 0)
+    return plan
+
+def manifest_entry(job, result, seconds):
+    output = result["output"]
+    entry = {
+        "university": job["university"], "year": job["year"], "semester": job["semester"],
+        "output": output,
+        "status": "ok" if result["completed"] else "failed", # 실패한 학기는 NDJSON + 체크포인트만 남음 (--resume)
+        "rows": result["rows"],
+        "seconds": round(seconds, 1),
+    }
+    # 이번에 쓴 파일만 해시 (실패해서 안 썼으면 예전 파일이 남아 있어도 기록하지 않음)
+    if result["rows"] is not None and os.path.exists(output):
+        entry["bytes"] = os.path.getsize(output)
+        entry["sha256"] = file_hash(output)
+    if "error" in result:
+        entry["error"] = result["error"]
+    return entry
+
+# 한 학교의 학기들을 순서대로 (워커 프로세스 안에서 실행)
+def run_university(university, jobs, workers, out_dir, common):
+    shared = {}
+    entries = []
+    crawler = None
+    try:
+        for job in jobs:
+            output = term_file(out_dir, job)
+            started = time.perf_counter()
+            METRICS.reset()
+            try:
+                args = parse_args([university, "--workers", str(workers), *common, *job.get("args", []),
+                                   "--year", str(job["year"]), "--semester", str(job["semester"]), "--output", output])
+                crawler = CRAWLERS[university](args)
+                result = run(crawler, args, shared)
+            except (Exception, SystemExit) as e: # 잘못된 옵션(SystemExit) 등으로 한 학기가 죽어도 다음 학기는 진행 (Ctrl-C 는 멈춤)
+                result = {"output": output, "completed": False, "rows": None, "error": repr(e)}
+            entries.append(manifest_entry(job, result, time.perf_counter() - started))
+    finally:
+        close_shards(shared)
+        if shared.get("driver") is not None and crawler is not None:
+            crawler.close_browser(shared["driver"])
+    return entries
+
+def write_manifest(path, manifest):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    common = []
+    if "--" in argv:
+        argv, common = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+
+    parser = argparse.ArgumentParser(description="여러 학교/학기 일괄 크롤링")
+    parser.add_argument("jobs", nargs="*", type=parse_job, help="학교:연도:학기 (예: KOREA:2025:2)")
+    parser.add_argument("--jobs", dest="jobs_file", help="작업 목록 JSON")
+    parser.add_argument("--budget", type=lambda text: max(1, int(text)), default=os.cpu_count() or 1, help="전체 동시 실행 수 (기본: CPU 코어 수)")
+    parser.add_argument("--out-dir", default=".", help="학기별 결과와 manifest.json 을 쓸 폴더")
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs + (load_jobs(args.jobs_file) if args.jobs_file else [])
+    if not jobs:
+        parser.error("작업이 없습니다. 학교:연도:학기 또는 --jobs 를 주세요.")
+    unknown = sorted({job["university"] for job in jobs} - set(CRAWLERS))
+    if unknown:
+        parser.error(f"모르는 학교: {', '.join(unknown)} (가능: {', '.join(sorted(CRAWLERS))})")
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job["university"], []).append(job)
+    plan = plan_workers(list(groups), args.budget, common)
+    print(f"🗓️ 작업 {len(jobs)}개 / 예산 {args.budget}: " + ", ".join(f"{name} {len(groups[name])}학기 × {plan[name]}" for name in groups))
+
+    manifest_path = os.path.join(args.out_dir, MANIFEST_FILE)
+    manifest = {"started": time.strftime("%Y-%m-%dT%H:%M:%S"), "budget": args.budget, "common_args": common, "jobs": []}
+    with ProcessPoolExecutor(max_workers=min(len(groups), args.budget)) as executor:
+        futures = [executor.submit(run_university, name, group, plan[name], args.out_dir, common) for name, group in groups.items()]
+        for future in as_completed(futures):
+            manifest["jobs"].extend(future.result())
+            write_manifest(manifest_path, manifest) # 학교 하나 끝날 때마다 갱신
+    # 작업 순서대로 정렬해서 마무리
+    order = {(job["university"], job["year"], job["semester"]): index for index, job in enumerate(jobs)}
+    manifest["jobs"].sort(key=lambda entry: order[(entry["university"], entry["year"], entry["semester"])])
+    manifest["finished"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    write_manifest(manifest_path, manifest)
+
+    print(f"\n📋 {manifest_path}")
+    for entry in manifest["jobs"]:
+        rows = "-" if entry["rows"] is None else entry["rows"]
+        print(f"   {entry['university']:<8}{entry['year']}-{entry['semester']}  {entry['status']:<8}{rows:>6}행  {entry.get('sha256', '')[:12]}")
+    if any(entry["status"] != "ok" for entry in manifest["jobs"]):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import itertools
+import os
+import time
+
+from combinator import generate_timetables, load_courses
+from timeslots import parse_slots
+
+# ==========================================
+# ⏱️ 시간표 조합 엔진 벤치마크 (최악 조건 위주)
+# ==========================================
+# 분반이 아주 많은 필수 과목들을 묶어서 첫 결과까지 / K개까지 걸리는 시간을 재고,
+# 단순 방식(고정 순서 + 모든 조합 나열 + 슬롯끼리 쌍 비교)과 비교합니다.
+# 진짜 최악은 '거의 다 겹치는' 조합과 '해가 아예 없는' 조합: 단순 방식은 곱집합을 끝까지 다 돌아야 함
+# (단순 방식은 --naive-timeout 초에서 끊음)
+#   python bench_combinator.py --limit 10000
+
+RESOURCES_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "main", "resources")
+
+SCENARIOS = [
+    # (이름, 파일, 필수, 선택)
+    ("고려대 분반 최다 5과목", "real_lectures_korea_2026_1.json", ["IFLS800", "GEWR002", "GEKS007", "GELI005", "CHEM153"], []),
+    ("고려대 이공계 기초", "real_lectures_korea_2026_1.json", ["CHEM153", "PHYS161", "MATH161", "LIBS153"], ["GEWR002", "GELI005"]),
+    ("한양대 분반 최다 3과목", "real_lectures_hanyang_full.json", ["CUL1122", "GEN5029", "CUL1138"], []),
+    ("한양대 교양 묶음", "real_lectures_hanyang_full.json", ["CUL0203", "CUL0205", "CUL0208", "GEN2052"], ["SYH0001"]),
+    # 충돌이 심해서 곱집합 중 1% 도 안 되는 조합만 가능
+    ("고려대 충돌 심한 5과목", "real_lectures_korea_2026_1.json", ["GEWR002", "LIBS150", "IFLS108", "CHIN103", "ARCH333"], []),
+    ("한양대 충돌 심한 5과목", "real_lectures_hanyang_full.json", ["ARE4088", "HOM4021", "ITE2037", "GEN5026", "GEN6032"], []),
+    # 해 없음: 분반끼리 전부 겹치는 두 과목(ARCH103/ARCH333, BUS1059/MAE3027) + 분반 많은 과목들
+    ("고려대 해 없음", "real_lectures_korea_2026_1.json", ["IFLS800", "GEWR002", "GELI005", "ARCH103", "ARCH333"], []),
+    ("한양대 해 없음", "real_lectures_hanyang_full.json", ["CUL0205", "CUL0203", "GEN2052", "BUS1059", "MAE3027"], []),
+]
+
+# 비교용 단순 방식: 필수 과목 분반의 곱집합을 다 돌면서 슬롯 쌍을 일일이 비교
+def naive_timetables(courses, required, university, limit, timeout=None):
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    slots = {s.id: parse_slots(s.lecture["timeRoom"], university, s.lecture["name"]) for c in required for s in courses[c]}
+
+    def overlap(a, b):
+        return any(x["day"] == y["day"] and x["start"] < y["end"] and y["start"] < x["end"] for x in slots[a.id] for y in slots[b.id])
+
+    produced = 0
+    for combo in itertools.product(*(courses[c] for c in required)):
+        if deadline is not None and time.perf_counter() > deadline:
+            return
+        if any(overlap(a, b) for a, b in itertools.combinations(combo, 2)): continue
+        yield combo
+        produced += 1
+        if produced >= limit:
+            return
+
+def timed(generator):
+    started = time.perf_counter()
+    first, count = None, 0
+    for _ in generator:
+        count += 1
+        if first is None:
+            first = time.perf_counter() - started
+    return first, time.perf_counter() - started, count
+
+def main():
+    parser = argparse.ArgumentParser(description="시간표 조합 엔진 벤치마크")
+    parser.add_argument("--limit", type=int, default=10000, help="시나리오마다 최대 몇 개까지 만들지 (K)")
+    parser.add_argument("--skip-naive", action="store_true")
+    parser.add_argument("--naive-timeout", type=float, default=30.0, help="단순 방식은 시나리오마다 이 시간(초)에서 중단")
+    args = parser.parse_args()
+
+    loaded = {}
+    for name, filename, required, optional in SCENARIOS:
+        if filename not in loaded:
+            loaded[filename] = load_courses(os.path.join(RESOURCES_DIR, filename))
+        courses = loaded[filename]
+        university = "HANYANG" if "hanyang" in filename else "KOREA"
+        sizes = "×".join(str(len(courses[c])) for c in required)
+        product = 1
+        for course in required:
+            product *= len(courses[course])
+
+        first, total, count = timed(generate_timetables(courses, required, optional, args.limit))
+        print(f"\n📊 {name} (분반 {sizes} = {product:,}{', 선택 ' + str(len(optional)) + '과목' if optional else ''})")
+        print(f"   엔진 : 첫 결과 {_ms(first)}, {count}개 {_ms(total)}")
+
+        if not args.skip_naive and not optional:
+            first, total, count = timed(naive_timetables(courses, required, university, args.limit, args.naive_timeout))
+            stopped = " (시간 초과로 중단)" if total >= args.naive_timeout else ""
+            print(f"   단순 : 첫 결과 {_ms(first)}, {count}개 {_ms(total)}{stopped}")
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f} ms"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import html
+import json
+import os
+import tempfile
+import time
+
+from browser import launch_chrome
+from hanyang_univ import CELL_IDS, extract_rows, extract_rows_per_cell
+
+# ==========================================
+# ⏱️ 한양대 행 추출 벤치마크: 칸마다 WebDriver 호출 vs 스크립트 한 번
+# ==========================================
+# 실제 포털 대신, 저장된 real_lectures_hanyang_full.json 으로 같은 구조(td id)의
+# 페이지를 로컬 파일로 만들어 헤드리스 크롬에서 측정합니다.
+#   python bench_extract.py --rows 100 --repeat 5
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "src", "main", "resources", "real_lectures_hanyang_full.json")
+
+def build_page(lectures):
+    rows = []
+    for lec in lectures:
+        cells = {
+            "gwamokNm": lec["name"],
+            "haksuNo": lec["id"],
+            "hakjeom": str(lec["credit"]),
+            "suupTimes": lec["timeRoom"],
+            "daepyoGangsaNm": lec["professor"],
+            "isuGbNm": lec["category"],
+            "suupTypeGb": lec["details"],
+        }
+        tds = "".join(f'<td id="{cell_id}">{html.escape(cells[cell_id]).replace(chr(10), "<br>")}</td>' for cell_id in CELL_IDS)
+        rows.append(f"<tr>{tds}</tr>")
+    return f"<html><body><table><tbody>{''.join(rows)}</tbody></table></body></html>"
+
+def measure(fn, driver, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(driver)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description="한양대 행 추출 벤치마크")
+    parser.add_argument("--rows", type=int, default=100, help="한 페이지 행 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        lectures = json.load(f)[:args.rows]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        f.write(build_page(lectures))
+        page_path = f.name
+
+    driver = launch_chrome(headless=True)
+    try:
+        driver.get("file://" + page_path)
+        per_cell, old_rows = measure(extract_rows_per_cell, driver, args.repeat)
+        bulk, new_rows = measure(extract_rows, driver, args.repeat)
+    finally:
+        driver.quit()
+        os.unlink(page_path)
+
+    # 예전 방식은 칸이 없는 행도 빈 dict 로 돌려주므로 비교 전에 걸러냄
+    same = [r for r in old_rows if r] == new_rows
+    print(f"📊 {len(lectures)}행 / 페이지 (최소값, {args.repeat}회)")
+    print(f"   칸마다 호출 : {per_cell * 1000:8.1f} ms")
+    print(f"   스크립트 1회: {bulk * 1000:8.1f} ms  (x{per_cell / bulk:.1f})")
+    print(f"   결과 일치   : {'✅' if same else '❌'}")
+
+if __name__ == "__main__":
+    main()
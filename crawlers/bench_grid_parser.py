@@ -0,0 +1,118 @@
+import argparse
+import contextlib
+import glob
+import html
+import io
+import json
+import os
+import time
+
+from bs4 import BeautifulSoup
+
+from grid_parser import SoupBackend, available_backends, get_backend
+from korea_univ import parse_grid_html
+
+# ==========================================
+# ⏱️ 고려대 그리드 파서 벤치마크: 페이지 전체 BeautifulSoup vs 그리드 조각 + 백엔드별
+# ==========================================
+# 픽스처: --fixtures 폴더의 녹화 응답(*.body, --record 로 저장한 것)
+#         없으면 저장소의 real_lectures_korea_2026_1.json 으로 실제 화면과 비슷한 전체 페이지를 조합별로 만듦
+# 모든 백엔드 결과가 예전 방식과 완전히 같은지도 같이 확인합니다.
+#   python bench_grid_parser.py --repeat 5
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "..", "src", "main", "resources", "real_lectures_korea_2026_1.json")
+
+# 예전 방식: page_source 전체를 html.parser 로 파싱
+class FullPageSoup(SoupBackend):
+    name = "full page (기존)"
+
+    def rows(self, page):
+        soup = BeautifulSoup(page, "html.parser")
+        rows = soup.select('#gridLecture > tbody > tr')
+        if not rows and not soup.select('#gridLecture'):
+            rows = soup.select('tr')
+        return rows
+
+# 실제 수강편람 화면처럼 메뉴/드롭다운/스크립트가 잔뜩 붙은 페이지
+def _noise():
+    menu = "".join(f'<li><a href="/menu/{i}" class="menu-item">메뉴 {i}</a></li>' for i in range(300))
+    options = "".join(f'<option value="{i:04d}">학과 {i}</option>' for i in range(400))
+    script = "<script>var config = " + json.dumps({f"key{i}": "값" * 20 for i in range(800)}, ensure_ascii=False) + ";</script>"
+    return f'<div id="header"><ul>{menu}</ul></div><form><select id="pDept">{options}</select></form>{script}'
+
+def _cell(text):
+    return f"<td>\n    {html.escape(text)}&nbsp;\n</td>"
+
+def _row(index, lecture):
+    course_id, section = lecture["id"].rsplit("-", 1)
+    name = html.escape(lecture["name"])
+    if "MOOC" in lecture["details"]:
+        name += ' <span class="label-type">M</span>'
+    time_room = "<br>".join(html.escape(part) for part in lecture["timeRoom"].split(" ", 1))
+    credit = f"{lecture['credit']:g}({lecture['credit']:g})"
+    return ("<tr>" + _cell(str(index)) + _cell(course_id) + _cell(section) + _cell(lecture["category"]) + "<td></td>"
+            + f"<td><a href=\"#\">{name}</a></td>" + _cell(lecture["professor"]) + _cell(credit)
+            + f"<td>{time_room}</td>" + _cell("") + "</tr>")
+
+def synthetic_fixtures():
+    with open(DATA_FILE, "r", encoding="utf-8") as f:
+        lectures = json.load(f)
+    groups = {}
+    for lecture in lectures:
+        groups.setdefault((lecture["category"], lecture["college"], lecture["department"]), []).append(lecture)
+
+    noise = _noise()
+    pages = []
+    for lectures in groups.values():
+        rows = "".join(_row(i, lecture) for i, lecture in enumerate(lectures, 1))
+        pages.append(f'<html><head><title>수강편람</title></head><body>{noise}'
+                     f'<table id="gridLecture" class="grid"><thead><tr><th>No</th><th>학수번호</th></tr></thead>'
+                     f'<tbody>{rows}</tbody></table><div id="footer">{noise}</div></body></html>')
+    return pages
+
+def load_fixtures(directory):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.body"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+def parse_all(pages, backend):
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()): # "✅ N건 수집 완료" 출력 숨김
+        for page in pages:
+            lectures = []
+            parse_grid_html(page, "전공", "대학", "학과", lectures, set(), backend)
+            results.append(lectures)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="고려대 그리드 파서 벤치마크")
+    parser.add_argument("--fixtures", help="녹화 응답(*.body) 폴더 (없으면 합성 페이지)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixtures) if args.fixtures else synthetic_fixtures()
+    size = sum(len(page) for page in pages) / len(pages) / 1024
+    print(f"📊 픽스처 {len(pages)}페이지 (평균 {size:.0f} KB)")
+
+    baseline = FullPageSoup()
+    expected = parse_all(pages, baseline)
+    rows = sum(len(lectures) for lectures in expected)
+
+    base_time = None
+    for backend in [baseline] + [get_backend(name) for name in reversed(available_backends())]:
+        elapsed = min(_timed(pages, backend) for _ in range(args.repeat))
+        base_time = base_time or elapsed
+        same = parse_all(pages, backend) == expected
+        print(f"   {backend.name:<18}{elapsed * 1000:9.1f} ms  {elapsed * 1000 / len(pages):7.2f} ms/페이지"
+              f"  ×{base_time / elapsed:5.1f}  {'✅ 결과 동일' if same else '❌ 결과 다름'}")
+    print(f"   (행 {rows}개)")
+
+def _timed(pages, backend):
+    started = time.perf_counter()
+    parse_all(pages, backend)
+    return time.perf_counter() - started
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import argparse
+import os
+import random
+import statistics
+import time
+
+from output import guess_university, read_lectures, with_section_ids
+from search_index import CHOSEONG, FIELDS, SearchIndex, find, jamo, normalize
+
+# ==========================================
+# ⏱️ 검색: 서버식 전체 순회(contains) vs 미리 만든 인덱스
+# ==========================================
+# 검색어: 실제 강의명/교수명/학수번호에서 뽑은 조각 + 입력 중인 자모 접두어("컴퓨ㅌ")
+# 검색창에 처음 치는 한 글자("ㄱ", "기")는 걸리는 행이 가장 많아서 따로 잽니다 (자동완성처럼 --limit 개만).
+# 인덱스 결과가 같은 규칙으로 모든 행을 순회한 결과와 완전히 같은지도 같이 확인합니다.
+# (id 는 서버와 같은 분반 id - 한양대 "CUL1122-03")
+#   python bench_search.py --queries 2000
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "main", "resources")
+DATASETS = ["real_lectures_korea_2026_1.json", "real_lectures_hanyang_full.json"]
+
+# TimeTableService.getSearchLectures 와 같은 방식 (매번 전체 강의를 돌며 소문자 contains)
+def linear_scan(lectures, keyword):
+    k = keyword.strip().lower()
+    ids = []
+    for lecture in lectures:
+        if k in lecture["name"].lower() or k in lecture["professor"].lower() or k in lecture["id"].lower():
+            ids.append(lecture["id"])
+    return list(dict.fromkeys(ids))
+
+# 인덱스와 같은 규칙(정규화 + 자모 접두어)으로 모든 행을 순회 - 결과 비교용 (인덱스가 만든 데이터는 쓰지 않음)
+def normalized_rows(lectures):
+    return [(lecture["id"], [normalize(lecture.get(field, "")) for field in FIELDS]) for lecture in lectures]
+
+def linear_normalized(rows, keyword):
+    query = normalize(keyword)
+    tail = jamo(query[-1])
+    return {lecture_id for lecture_id, fields in rows if any(find(field, query, tail) != -1 for field in fields)}
+
+def sample_queries(lectures, count, rng):
+    queries = []
+    while len(queries) < count:
+        lecture = rng.choice(lectures)
+        kind = rng.random()
+        if kind < 0.5:
+            name = normalize(lecture["name"])
+            if len(name) < 2: continue
+            size = rng.randint(2, min(4, len(name)))
+            start = rng.randrange(len(name) - size + 1)
+            queries.append(name[start:start + size])
+        elif kind < 0.7:
+            if lecture["professor"]: queries.append(lecture["professor"])
+        elif kind < 0.8:
+            queries.append(lecture["id"][:rng.randint(3, 6)])
+        else:
+            # 입력 중: 앞 글자들 + 다음 글자의 초성
+            name = normalize(lecture["name"])
+            if len(name) < 2: continue
+            size = rng.randint(1, min(3, len(name) - 1))
+            queries.append(name[:size] + jamo(name[size])[0])
+    return queries
+
+# 초성 19개 + 강의명/교수명 첫 글자에서 뽑은 한 글자 (겹치지 않게 → 인덱스 cold 는 전부 처음 보는 글자)
+def short_queries(lectures, count, rng):
+    firsts = sorted({normalize(lecture[field])[:1] for lecture in lectures for field in ("name", "professor")} - {""} - set(CHOSEONG))
+    return list(CHOSEONG) + rng.sample(firsts, min(count, len(firsts)))
+
+def timed(fn, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return statistics.mean(latencies), latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+def main():
+    parser = argparse.ArgumentParser(description="강의 검색 인덱스 벤치마크")
+    parser.add_argument("files", nargs="*", help="결과 파일 (기본: 저장소의 고려대/한양대 결과)")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--short-queries", type=int, default=200, help="한 글자 검색어 수 (초성 19개는 항상 포함)")
+    parser.add_argument("--limit", type=int, default=20, help="한 글자 검색에서 받을 결과 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for path in args.files or [os.path.join(DATA_DIR, name) for name in DATASETS]:
+        university = guess_university(path)
+        lectures = list(with_section_ids(read_lectures(path), university))
+        started = time.perf_counter()
+        index = SearchIndex.build(read_lectures(path), university)
+        build_ms = (time.perf_counter() - started) * 1000
+        queries = sample_queries(lectures, args.queries, rng)
+
+        rows = normalized_rows(lectures)
+        same = all(set(index.search(query)) == linear_normalized(rows, query) for query in queries)
+        print(f"📊 {os.path.basename(path)}: 강의 {len(lectures)}개, 인덱스 생성 {build_ms:.0f} ms, 검색어 {len(queries)}개")
+        for label, fn in [("전체 순회 (서버 방식)", lambda q: linear_scan(lectures, q)), ("인덱스", index.search)]:
+            mean, p50, p99 = timed(fn, queries)
+            print(f"   {label:<16} 평균 {mean:7.3f} ms   p50 {p50:7.3f} ms   p99 {p99:7.3f} ms")
+        print(f"   {'✅ 결과 동일' if same else '❌ 결과 다름'} (인덱스 vs 같은 규칙으로 모든 행 순회)")
+
+        # 한 글자: 인덱스는 처음 보는 글자(cold)와 이미 찾아본 글자(warm)를 나눠서
+        shorts = short_queries(lectures, args.short_queries, rng)
+        same = all(set(index.search(query)) == linear_normalized(rows, query) for query in shorts)
+        fresh = SearchIndex(index.ids, index.texts, index.postings)
+        print(f"   한 글자 검색어 {len(shorts)}개 (결과 {args.limit}개)")
+        for label, fn in [("전체 순회 (서버 방식)", lambda q: linear_scan(lectures, q)),
+                          ("인덱스 cold", lambda q: fresh.search(q, args.limit)),
+                          ("인덱스 warm", lambda q: fresh.search(q, args.limit))]:
+            mean, p50, p99 = timed(fn, shorts)
+            print(f"   {label:<16} 평균 {mean:7.3f} ms   p50 {p50:7.3f} ms   p99 {p99:7.3f} ms")
+        print(f"   {'✅ 결과 동일' if same else '❌ 결과 다름'} (인덱스 vs 같은 규칙으로 모든 행 순회)")
+
+if __name__ == "__main__":
+    main()
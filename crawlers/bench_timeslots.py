@@ -0,0 +1,58 @@
+import argparse
+import json
+import os
+import time
+
+import timeslots
+
+# ==========================================
+# ⏱️ timeRoom → 슬롯 변환 처리량 측정
+# ==========================================
+# 코퍼스 = 저장소에 들어있는 두 결과 파일의 모든 (timeRoom, 강의명)
+#   python bench_timeslots.py --repeat 20
+
+RESOURCES_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "main", "resources")
+DATASETS = [("KOREA", "real_lectures_korea_2026_1.json"), ("HANYANG", "real_lectures_hanyang_full.json")]
+
+# 시간 정보가 원래 없는 문자열 (빈 칸, 미정, 시간미지정강좌 등) → 슬롯이 없어도 '실패'로 세지 않음
+NO_SCHEDULE = ("", "미정", "시간미지정강좌", "집중수업")
+
+def load_corpus():
+    corpus = []
+    for university, filename in DATASETS:
+        with open(os.path.join(RESOURCES_DIR, filename), "r", encoding="utf-8") as f:
+            corpus.extend((university, lec["timeRoom"], lec["name"]) for lec in json.load(f))
+    return corpus
+
+def run(corpus):
+    started = time.perf_counter()
+    for university, time_room, name in corpus:
+        timeslots.parse_slots(time_room, university, name)
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="timeRoom 파싱 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    unique = len({(u, t) for u, t, _ in corpus})
+
+    # 캐시 없이 (매번 정규식 파싱) vs 메모이즈된 상태
+    cold = []
+    for _ in range(args.repeat):
+        timeslots.clear_cache()
+        cold.append(run(corpus))
+    warm = min(run(corpus) for _ in range(args.repeat))
+    cold = min(cold)
+
+    unparsed = [t for u, t, n in corpus if not timeslots.parse_slots(t, u, n) and t.split("\n")[0] not in NO_SCHEDULE]
+    slots = sum(len(timeslots.parse_slots(t, u, n)) for u, t, n in corpus)
+
+    print(f"📊 코퍼스: {len(corpus)}행 (서로 다른 timeRoom {unique}종) → 슬롯 {slots}개")
+    print(f"   첫 실행(캐시 비움): {cold * 1000:7.1f} ms  ({len(corpus) / cold:,.0f} 행/초)")
+    print(f"   메모이즈 상태    : {warm * 1000:7.1f} ms  ({len(corpus) / warm:,.0f} 행/초)")
+    print(f"   파싱 실패        : {len(unparsed)}행 {sorted(set(unparsed))[:5]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+try:
+    import numpy as np
+except ImportError: # numpy 없으면 일괄 검사만 순수 파이썬으로
+    np = None
+
+from timeslots import parse_slots
+
+# ==========================================
+# 🧮 강의별 주간 비트마스크 (시간 충돌 검사를 AND 한 번으로)
+# ==========================================
+# 하루를 5분 칸 288개로 나누고 월~일 7일을 이어 붙인 2016비트 정수.
+#   충돌 여부:  a & b != 0
+#   시간표 합치기: a | b
+# 크롤링 결과(NDJSON/SQLite/Parquet)에는 lecture["weekMask"] 에 16진수 문자열로 저장합니다 (서버용 JSON 배열엔 안 넣음).
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+DAY_INDEX = {day: index for index, day in enumerate(DAYS)}
+WEEK_BITS = SLOTS_PER_DAY * len(DAYS)
+WORDS = (WEEK_BITS + 63) // 64 # numpy 일괄 검사용 uint64 칸 수
+
+# 시작은 내림, 끝은 올림 → 5분 칸에 조금이라도 걸치면 사용 중으로 봄
+def slots_mask(slots):
+    mask = 0
+    for slot in slots:
+        if slot["end"] <= slot["start"] or slot["day"] not in DAY_INDEX: continue
+        base = DAY_INDEX[slot["day"]] * SLOTS_PER_DAY
+        first = base + slot["start"] // SLOT_MINUTES
+        last = base + min(-(-slot["end"] // SLOT_MINUTES), SLOTS_PER_DAY)
+        mask |= ((1 << (last - first)) - 1) << first
+    return mask
+
+# 크롤링 결과 파일처럼 slots 가 이미 있으면 그대로, 없으면 timeRoom 을 파싱해서
+def lecture_mask(lecture, university):
+    slots = lecture.get("slots")
+    if slots is None:
+        slots = parse_slots(lecture.get("timeRoom", ""), university, lecture.get("name", ""))
+    return slots_mask(slots)
+
+def conflicts(a, b):
+    return a & b != 0
+
+def union(masks):
+    result = 0
+    for mask in masks:
+        result |= mask
+    return result
+
+def to_hex(mask):
+    return format(mask, "x")
+
+def from_hex(text):
+    return int(text, 16) if text else 0
+
+# ==========================================
+# 🚀 후보 하나 vs 강의 수천 개 일괄 검사 (numpy)
+# ==========================================
+def to_words(mask):
+    return [(mask >> (64 * i)) & 0xFFFFFFFFFFFFFFFF for i in range(WORDS)]
+
+# 마스크 목록 → (n, WORDS) uint64 행렬. 한 번 만들어 두고 계속 재사용
+def pack(masks):
+    if np is None:
+        return list(masks)
+    return np.array([to_words(mask) for mask in masks], dtype=np.uint64).reshape(-1, WORDS)
+
+# candidate 와 겹치는 강의 위치를 True 로 표시한 배열 (numpy 없으면 bool 리스트)
+def batch_conflicts(candidate, packed):
+    if np is None:
+        return [candidate & mask != 0 for mask in packed]
+    words = np.array(to_words(candidate), dtype=np.uint64)
+    return (packed & words).any(axis=1)
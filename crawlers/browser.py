@@ -0,0 +1,202 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from instrument import METRICS
+
+# ==========================================
+# 🌍 크롬 띄우기 (크롤러 공통)
+# ==========================================
+DRIVER_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "schedule-crawler", "chromedriver.path")
+
+# chromedriver 경로는 한 번만 찾고 파일에 적어둠 → 다음 실행부터는 webdriver-manager 조회(네트워크) 없이 바로 시작
+# CHROMEDRIVER 환경변수가 있으면 그걸 우선 사용
+@lru_cache(maxsize=None)
+def chromedriver_path():
+    if os.environ.get("CHROMEDRIVER"):
+        return os.environ["CHROMEDRIVER"]
+    if os.path.exists(DRIVER_CACHE):
+        with open(DRIVER_CACHE, "r", encoding="utf-8") as f:
+            path = f.read().strip()
+        if os.path.exists(path):
+            return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    os.makedirs(os.path.dirname(DRIVER_CACHE), exist_ok=True)
+    with open(DRIVER_CACHE, "w", encoding="utf-8") as f:
+        f.write(path)
+    return path
+
+# 크롬이 자동 업데이트되면 적어둔 chromedriver 는 버전이 안 맞아 매번 SessionNotCreated
+# → 적어둔 경로를 버리고 webdriver-manager 로 다시 찾아서(설치된 크롬 버전에 맞춤) 한 번만 다시 시도
+_refresh_lock = threading.Lock()
+
+def start_chrome(chrome_options):
+    path = chromedriver_path()
+    try:
+        return webdriver.Chrome(service=Service(path), options=chrome_options)
+    except SessionNotCreatedException:
+        if os.environ.get("CHROMEDRIVER"): raise # 직접 지정한 경로는 건드리지 않음
+        with _refresh_lock:
+            if chromedriver_path() == path: # 다른 스레드가 이미 갱신했으면 그대로 씀
+                print("   🔄 chromedriver 가 크롬 버전과 안 맞아서 다시 찾습니다...")
+                if os.path.exists(DRIVER_CACHE):
+                    os.remove(DRIVER_CACHE)
+                chromedriver_path.cache_clear()
+        return webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+
+# 이미 떠 있는 디버깅 크롬에 붙기 (로그인/보안 프로그램 때문에 사람이 먼저 열어둔 창)
+# 🚨 실행 전 CMD에서 크롬 디버깅 모드 실행 필수:
+# chrome.exe --remote-debugging-port=9222 --user-data-dir="C:\selenium\ChromeProfile"
+def attach_debug_chrome(address="127.0.0.1:9222"):
+    chrome_options = Options()
+    chrome_options.add_experimental_option("debuggerAddress", address)
+    return start_chrome(chrome_options)
+
+def launch_chrome(headless=False):
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+    # 시작 시간/메모리 줄이기 (표 텍스트만 필요하므로 이미지도 안 받음)
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    return start_chrome(chrome_options)
+
+# 🧵 병렬 모드 워커용: 헤드리스 크롬을 새로 띄우고 메인 브라우저의 세션(쿠키)을 이어받음
+def launch_headless(url, cookies):
+    driver = launch_chrome(headless=True)
+
+    # 쿠키는 같은 도메인에 먼저 접속해야 심을 수 있음
+    driver.get(url)
+    for cookie in cookies:
+        cookie = {k: v for k, v in cookie.items() if k in ("name", "value", "path", "domain", "secure", "httpOnly")}
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+    driver.get(url)
+    return driver
+
+# ==========================================
+# ♻️ 브라우저 풀 (재사용 + 상태 검사 + 교체)
+# ==========================================
+# 조회마다 빌려 쓰고 돌려주는 크롬 묶음.
+#   - 빌려줄 때마다 상태 검사 → 죽었거나(크래시/세션 끊김) 메모리가 너무 커졌으면 버리고 새로 띄움
+#   - max_uses 번 쓴 브라우저도 새로 교체 (긴 크롤링에서 크롬 프로세스 하나가 메모리를 계속 먹는 것 방지)
+#   - seed: 이미 떠 있는 브라우저를 풀에 넣기 (디버깅 크롬처럼 사람이 로그인해 둔 창)
+#           쿠키를 옮긴 헤드리스가 같은 세션이 된다는 보장이 없어서 max_uses/메모리로는 교체하지 않고, 죽었을 때만 교체 (닫지도 않음)
+#           대신할 수 없는 세션이면 factory 에서 SessionLost 를 올려서 크롤링을 멈춤 (engine.crawl_queries)
+#
+#   pool = BrowserPool(lambda: launch_headless(url, cookies), size=4, max_uses=200)
+#   pool.warm()
+#   with pool.session() as driver: ...
+
+HEAP_LIMIT_MB = 1024
+
+# 새 브라우저로 대신할 수 없는 세션(사람이 로그인해 둔 창)이 죽었음 → 재시도하지 않고 크롤링 중단
+class SessionLost(RuntimeError):
+    pass
+
+class _Slot:
+    def __init__(self, driver=None, owned=True):
+        self.driver = driver
+        self.owned = owned
+        self.uses = 0
+
+class BrowserPool:
+    def __init__(self, factory, size=1, max_uses=None, seed=()):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.slots = [_Slot(driver, owned=False) for driver in seed]
+        self.slots += [_Slot() for _ in range(max(0, size - len(self.slots)))]
+        self.idle = queue.Queue()
+        for slot in self.slots:
+            self.idle.put(slot)
+        self.lock = threading.Lock()
+
+    # 빈 자리를 전부 미리 띄워둠 (크롬 여러 개를 동시에 시작)
+    def warm(self):
+        empty = [slot for slot in self.slots if slot.driver is None]
+        if not empty: return
+        with ThreadPoolExecutor(max_workers=len(empty)) as executor:
+            for slot, driver in zip(empty, executor.map(lambda _: self._launch(), empty)):
+                slot.driver = driver
+
+    def _launch(self):
+        with METRICS.stage("browser_start"):
+            driver = self.factory()
+        METRICS.count("browser_started")
+        return driver
+
+    def _retire(self, slot, reason):
+        METRICS.count(f"browser_{reason}")
+        if slot.owned and slot.driver is not None:
+            try:
+                slot.driver.quit()
+            except Exception:
+                pass
+        slot.driver, slot.owned, slot.uses = None, True, 0
+
+    @contextmanager
+    def session(self):
+        slot = self.idle.get()
+        try:
+            if slot.driver is not None:
+                reason = check_health(slot.driver)
+                if reason and not slot.owned and reason != "crashed":
+                    METRICS.count(f"seed_{reason}") # 넘겨받은 창은 살아 있는 한 계속 씀
+                    reason = None
+                if reason:
+                    print(f"   ♻️ 브라우저 교체 ({reason})")
+                    self._retire(slot, reason)
+            if slot.driver is None:
+                slot.driver = self._launch()
+
+            yield slot.driver
+
+            slot.uses += 1
+            if self.max_uses and slot.owned and slot.uses >= self.max_uses:
+                self._retire(slot, "recycled")
+        finally:
+            self.idle.put(slot)
+
+    # 떠 있는 브라우저 전부에 fn 을 적용 (쉬는 중일 때만, 예: 학기 바꾸기). 실패한 브라우저는 버리고 다음에 새로 띄움
+    def refresh(self, fn):
+        for slot in self.slots:
+            if slot.driver is None: continue
+            try:
+                fn(slot.driver)
+            except Exception:
+                self._retire(slot, "refresh_failed")
+
+    def close(self):
+        for slot in self.slots:
+            if slot.owned and slot.driver is not None:
+                try:
+                    slot.driver.quit()
+                except Exception:
+                    pass
+            slot.driver = None
+
+# 문제가 있으면 이유 문자열, 멀쩡하면 None
+def check_health(driver):
+    try:
+        heap = driver.execute_script("return window.performance && performance.memory ? performance.memory.usedJSHeapSize : 0;")
+    except Exception:
+        return "crashed"
+    if heap and heap / (1024 * 1024) > HEAP_LIMIT_MB:
+        return "bloated"
+    return None
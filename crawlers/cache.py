@@ -0,0 +1,160 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+# ==========================================
+# 🗄️ 조회 응답 캐시 (디스크, 내용 주소 방식)
+# ==========================================
+# 조회 한 번의 원본 응답(고려대 그리드 HTML, 한양대 페이지 행 목록)을 저장해 두고
+# 같은 조회(학교·학기 + pCourDiv/pGroupCd/pCol/pDept 또는 페이지 번호)는 다시 요청하지 않습니다.
+#   - 본문은 sha256 이름의 파일(zlib 압축)로 한 번만 저장 → 내용이 같은 응답끼리는 공유
+#   - 어떤 조회가 어떤 본문인지는 index.sqlite 에 기록
+#   - ttl 이 지난 항목은 없는 것으로 취급, 전체 크기가 max_bytes 를 넘으면 가장 오래 안 쓴 것부터 삭제 (LRU)
+# --replay 로 돌리면 네트워크/브라우저 없이 캐시만 읽어서 파싱 단계만 다시 돌릴 수 있음
+#   (파싱 규칙을 고친 뒤 결과 확인용)
+#
+#   python crawl.py KOREA --cache .cache/korea            # 평소처럼 크롤링하면서 캐시에 저장
+#   python crawl.py KOREA --cache .cache/korea --replay   # 캐시로 파싱만 다시
+#   python cache.py .cache/korea                          # 캐시 현황
+
+DEFAULT_TTL_HOURS = 24
+DEFAULT_MAX_MB = 500
+
+class CacheMiss(KeyError):
+    pass
+
+def cache_key(university, params):
+    canonical = json.dumps([university, sorted((str(k), str(v)) for k, v in params.items())], ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    def __init__(self, directory, ttl=DEFAULT_TTL_HOURS * 3600, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "objects"), exist_ok=True)
+
+    # 프로세스 풀 워커로 넘길 때는 연결 없이 설정만 보내고, 워커에서 다시 엶
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"], state["_lock"] = None, None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), timeout=30, check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY, university TEXT, query TEXT, digest TEXT, created REAL, accessed REAL);
+                CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER);
+                CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+                CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+            """)
+        return self._conn
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    # 없거나 ttl 이 지났으면 CacheMiss (ignore_ttl=True 면 오래된 것도 돌려줌 - 재생 모드)
+    def get(self, key, ignore_ttl=False):
+        with self._lock:
+            row = self.conn.execute("SELECT digest, created FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or (not ignore_ttl and self.ttl and row[1] < time.time() - self.ttl):
+                raise CacheMiss(key)
+            self.conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+        try:
+            with open(self._blob_path(row[0]), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except OSError:
+            raise CacheMiss(key)
+
+    def put(self, key, text, university="", query=None):
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(tmp_path, path)
+        now = time.time()
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)", (digest, os.path.getsize(path)))
+            self.conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                              (key, university, json.dumps(query, ensure_ascii=False), digest, now, now))
+            self.conn.commit()
+            self._evict()
+
+    def total_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    # 만료된 항목 → 오래 안 쓴 항목 순으로 지우고, 아무도 안 가리키는 본문 파일 정리
+    def _evict(self):
+        if not self.max_bytes or self.total_bytes() <= self.max_bytes:
+            return
+        if self.ttl:
+            self.conn.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,))
+        self._drop_orphans()
+        while self.total_bytes() > self.max_bytes:
+            oldest = self.conn.execute("SELECT key FROM entries ORDER BY accessed LIMIT 1").fetchone()
+            if oldest is None: break
+            self.conn.execute("DELETE FROM entries WHERE key = ?", oldest)
+            self._drop_orphans()
+        self.conn.commit()
+
+    def _drop_orphans(self):
+        orphans = self.conn.execute("SELECT digest FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)").fetchall()
+        for (digest,) in orphans:
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+            self.conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+
+    # 조회 목록 (재생 모드에서 같은 순서로 돌기 위해)
+    def save_queries(self, university, queries):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (f"queries:{university}", json.dumps(queries, ensure_ascii=False)))
+            self.conn.commit()
+
+    def load_queries(self, university):
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (f"queries:{university}",)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def stats(self):
+        entries = self.conn.execute("SELECT university, COUNT(*) FROM entries GROUP BY university").fetchall()
+        blobs = self.conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+        return {"entries": dict(entries), "blobs": blobs, "bytes": self.total_bytes()}
+
+def main():
+    parser = argparse.ArgumentParser(description="조회 응답 캐시 현황 / 비우기")
+    parser.add_argument("directory")
+    parser.add_argument("--max-mb", type=float, help="이 크기까지 LRU 로 줄이기")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.directory)
+    if args.max_mb is not None:
+        cache.max_bytes = int(args.max_mb * 1024 * 1024)
+        with cache._lock:
+            cache._evict()
+    stats = cache.stats()
+    print(f"🗄️ {args.directory}: 본문 {stats['blobs']}개, {stats['bytes'] / 1024 / 1024:.1f} MB")
+    for university, count in stats["entries"].items():
+        print(f"   {university}: 조회 {count}건")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import json
+import os
+
+# ==========================================
+# 💾 중간 저장 (체크포인트) & 이어하기
+# ==========================================
+# 체크포인트 = {"position": 마지막으로 끝낸 위치, "written": 그 시점까지 NDJSON 에 쓴 줄 수, ...크롤러별 추가 정보}
+#   - 한양대: position = 마지막으로 수집 끝낸 페이지 번호
+#   - 고려대: position = 처리 끝낸 조회 조합 개수 (+ 조합 목록 자체도 "queries" 로 같이 저장해서 순서 고정)
+# 강의 자체는 NDJSON 출력 파일에 이미 있으므로 체크포인트는 줄 수만 기억 (이어할 때 그 뒤는 잘라냄)
+# 파일은 임시 파일에 다 쓴 뒤 os.replace 로 바꿔치기 → 저장 도중 죽어도 이전 체크포인트는 멀쩡함
+
+def checkpoint_path(output_file):
+    return output_file + ".checkpoint"
+
+def save_checkpoint(path, state):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    print(f"   💾 체크포인트 저장 (위치 {state['position']}, {state['written']}개)")
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    print(f"♻️ 체크포인트에서 이어서 시작 (위치 {state['position']}, {state['written']}개)")
+    return state
+
+# 끝까지 정상 종료했으면 지워서 다음 --resume 이 옛날 체크포인트를 집어오지 않게 함
+def clear_checkpoint(path):
+    if os.path.exists(path):
+        os.remove(path)
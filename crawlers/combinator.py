@@ -0,0 +1,123 @@
+import argparse
+import itertools
+from collections import namedtuple
+
+from bitmask import from_hex, lecture_mask
+from output import guess_university, read_lectures, with_section_ids
+from validate import content_hash
+
+# ==========================================
+# 🧩 오프라인 시간표 조합 엔진
+# ==========================================
+# 크롤링 결과(real_lectures_*.json)를 읽어 필수/선택 과목 목록으로 가능한 시간표를 하나씩 만들어 냅니다.
+#   - 분반은 기본 과목 ID 로 묶음 (고려대 "COSE101-02" → "COSE101", 한양대는 학수번호)
+#     한양대 분반 id 는 서버와 같이 "CUL1122-01", "-02" ... (학수번호가 분반마다 같아서)
+#   - 내용이 완전히 같은 행(한양대 결과에 많음)은 한 번만 → 같은 시간표가 여러 번 나오지 않음
+#   - 백트래킹 + '남은 선택지가 가장 적은 과목 먼저' (MRV) + 비트마스크 충돌 가지치기
+#   - 시간이 완전히 같은 분반은 한 덩어리로 탐색하고 결과를 낼 때만 펼침
+#   - 제너레이터라서 필요한 만큼만 꺼내 쓰면 되고, limit 개에서 바로 멈춤
+#
+#   python combinator.py ../src/main/resources/real_lectures_korea_2026_1.json COSE101 MATH161 --optional GEKS007 --limit 10
+
+Section = namedtuple("Section", ["id", "mask", "credit", "lecture"])
+
+def base_course_id(section_id):
+    return section_id.rsplit("-", 1)[0]
+
+# {기본 과목 ID: [Section, ...]}
+def load_courses(path, university=None):
+    university = university or guess_university(path) or "KOREA"
+    lectures = list(read_lectures(path))
+    courses, seen = {}, set()
+    # 번호는 서버처럼 중복 행까지 세서 매기고 (그래야 id 가 서버와 같음), 중복 행은 그다음에 버림
+    for row, lecture in zip(lectures, with_section_ids(lectures, university)):
+        digest = content_hash(row)
+        if digest in seen: continue
+        seen.add(digest)
+        mask = from_hex(lecture["weekMask"]) if "weekMask" in lecture else lecture_mask(lecture, university)
+        section = Section(lecture["id"], mask, lecture.get("credit", 0.0), lecture)
+        courses.setdefault(base_course_id(lecture["id"]), []).append(section)
+    return courses
+
+# 과목 하나의 분반들을 '시간 마스크'별로 묶음 → [(mask, [Section, ...]), ...]
+def _options(sections):
+    grouped = {}
+    for section in sections:
+        grouped.setdefault(section.mask, []).append(section)
+    return list(grouped.items())
+
+def generate_timetables(courses, required, optional=(), limit=None, max_credits=None):
+    missing = [course for course in list(required) + list(optional) if course not in courses]
+    if missing:
+        raise KeyError(f"없는 과목: {', '.join(missing)}")
+
+    required_options = {course: _options(courses[course]) for course in required}
+    optional_options = {course: _options(courses[course]) for course in optional}
+    produced = 0
+
+    # 고른 마스크 조합 → 실제 분반 조합으로 펼치기 (같은 시간의 분반들 곱집합)
+    def expand(chosen):
+        for sections in itertools.product(*(group for _, group in chosen)):
+            yield list(sections)
+
+    def search_optional(pending, used, credits, chosen):
+        if not pending:
+            yield chosen
+            return
+        course, rest = pending[0], pending[1:]
+        for mask, group in optional_options[course]:
+            credit = group[0].credit
+            if mask & used: continue
+            if max_credits is not None and credits + credit > max_credits: continue
+            yield from search_optional(rest, used | mask, credits + credit, chosen + [(course, group)])
+        # 이 선택 과목은 안 듣는 경우
+        yield from search_optional(rest, used, credits, chosen)
+
+    def search_required(pending, used, credits, chosen):
+        if not pending:
+            # 선택 과목은 선택지가 적은 것부터
+            order = sorted(optional_options, key=lambda course: len(optional_options[course]))
+            yield from search_optional(order, used, credits, chosen)
+            return
+
+        # MRV: 지금 시간표와 안 겹치는 선택지가 가장 적은 필수 과목부터 고정
+        # 어느 하나라도 0개면 이 가지는 더 볼 필요 없음 (forward checking)
+        best, best_fits = None, None
+        for course in pending:
+            fits = [(mask, group) for mask, group in required_options[course] if not mask & used]
+            if not fits:
+                return
+            if best_fits is None or len(fits) < len(best_fits):
+                best, best_fits = course, fits
+        rest = [course for course in pending if course != best]
+
+        for mask, group in best_fits:
+            credit = group[0].credit
+            if max_credits is not None and credits + credit > max_credits: continue
+            yield from search_required(rest, used | mask, credits + credit, chosen + [(best, group)])
+
+    for chosen in search_required(list(required), 0, 0.0, []):
+        for timetable in expand(chosen):
+            yield timetable
+            produced += 1
+            if limit is not None and produced >= limit:
+                return
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 시간표 조합 생성기")
+    parser.add_argument("data", help="크롤링 결과 파일 (.json / .ndjson)")
+    parser.add_argument("required", nargs="+", help="필수 과목 ID")
+    parser.add_argument("--optional", nargs="*", default=[], help="선택 과목 ID")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--max-credits", type=float)
+    parser.add_argument("--university", choices=["KOREA", "HANYANG"])
+    args = parser.parse_args()
+
+    courses = load_courses(args.data, args.university)
+    count = 0
+    for count, timetable in enumerate(generate_timetables(courses, args.required, args.optional, args.limit, args.max_credits), 1):
+        print(f"#{count}: " + ", ".join(f"{s.id} {s.lecture['timeRoom']}" for s in timetable))
+    print(f"\n🧩 시간표 {count}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import sys
+
+from engine import CRAWLERS, DEFAULT_SEMESTER, DEFAULT_YEAR, run
+from grid_parser import BACKENDS
+from cache import DEFAULT_MAX_MB, DEFAULT_TTL_HOURS
+import korea_univ, hanyang_univ # 크롤러 등록 (@register)
+
+# ==========================================
+# 🕷️ 통합 크롤러 CLI
+# ==========================================
+#   python crawl.py KOREA --http --endpoint korea_endpoint.json --workers 4
+#   python crawl.py KOREA --workers 4 --clone-session              # 헤드리스 병렬 (쿠키 복사 세션이 통하는지 확인한 경우만)
+#   python crawl.py HANYANG --http --endpoint hanyang_endpoint.json
+#   python crawl.py KOREA --http --endpoint korea_endpoint.json --queries rec/queries.json --base-url http://127.0.0.1:8765
+#   python crawl.py KOREA --year 2025 --semester 2             # → real_lectures_korea_2025_2.json
+#   (여러 학교/학기를 한 번에: batch.py)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="대학 수강편람 크롤러")
+    parser.add_argument("university", choices=sorted(CRAWLERS), help="크롤링할 학교")
+    parser.add_argument("--year", type=int, help=f"수집할 연도 (기본 {DEFAULT_YEAR})")
+    parser.add_argument("--semester", type=int, help=f"수집할 학기 (기본 {DEFAULT_SEMESTER})")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: 기본 학기면 서버가 읽는 파일, 아니면 real_lectures_{학교}_{연도}_{학기}.json)")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 개수 (브라우저 모드는 헤드리스 크롬 수, HTTP 모드는 동시 요청 수)")
+    parser.add_argument("--clone-session", action="store_true", help="쿠키를 옮긴 헤드리스 크롬으로 브라우저 병렬/교체 허용 (고려대는 확인 안 된 방식이라 기본은 꺼짐)")
+    parser.add_argument("--http", action="store_true", help="브라우저는 세션/조회 목록 확보에만 쓰고 그리드는 HTTP 로 직접 요청")
+    parser.add_argument("--endpoint", help="그리드 XHR 요청 정보 JSON ({url, method, params, page_param}) - --http 필수")
+    parser.add_argument("--record", help="HTTP 응답과 queries.json 을 이 폴더에 녹화 (stub_server.py 재생용)")
+    parser.add_argument("--base-url", help="요청을 보낼 호스트 교체 (예: http://127.0.0.1:8765 스텁 서버)")
+    parser.add_argument("--queries", "--combos", dest="queries", help="미리 저장한 조회 목록 JSON (있으면 조회 목록 탐색 생략)")
+    parser.add_argument("--parser", choices=BACKENDS, help="그리드 HTML 파서 (기본: 설치된 것 중 가장 빠른 것)")
+    parser.add_argument("--recycle-after", type=int, help="브라우저 하나로 조회 N번 하면 새로 교체 (0 이면 죽었을 때만, 기본값은 학교별)")
+    parser.add_argument("--retries", type=int, default=3, help="타임아웃/5xx/연결 끊김 같은 일시적 에러 재시도 횟수")
+    parser.add_argument("--min-interval", type=float, default=0.0, help="요청 시작 사이 최소 간격(초). 실제 간격은 포털 상태를 보고 자동 조절")
+    parser.add_argument("--cache", help="조회 응답 캐시 폴더 (같은 조회는 다시 요청하지 않음)")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL_HOURS, help="캐시 유효 시간 (시간 단위, 0 이면 무제한)")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_MB, help="캐시 최대 크기 (넘으면 오래 안 쓴 것부터 삭제)")
+    parser.add_argument("--replay", action="store_true", help="네트워크/브라우저 없이 캐시만으로 파싱 다시 (--cache 필수)")
+    parser.add_argument("--resume", action="store_true", help="마지막 체크포인트의 다음 조회부터 이어서 수집")
+    parser.add_argument("--checkpoint-every", type=int, help="조회 N번마다 체크포인트 저장 (기본값은 학교별)")
+    parser.add_argument("--gzip", action="store_true", help="NDJSON 출력을 gzip 으로 압축")
+    parser.add_argument("--compact", action="store_true", help="NDJSON 구분자 공백 제거")
+    parser.add_argument("--validate", action="store_true", help="다 모은 결과를 검증/정리하고 *.quality.json 리포트 저장 (validate.py)")
+    parser.add_argument("--drop-duplicates", action="store_true", default=None, help="--validate 에서 내용까지 같은 중복 행은 항상 버림 (한양대 기본값은 표시만)")
+    parser.add_argument("--sqlite", help="결과를 인덱스가 걸린 SQLite 파일로도 저장 (export.py)")
+    parser.add_argument("--parquet", help="결과를 Parquet 파일로도 저장 (pyarrow 필요)")
+    parser.add_argument("--search-index", help="강의명/교수명 검색 인덱스 파일도 저장 (search_index.py)")
+    parser.add_argument("--previous", help="이전 결과 JSON - 주면 바뀐 강의만 담은 *.delta.json 도 같이 저장")
+    return parser
+
+def parse_args(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.http and not args.endpoint:
+        parser.error("--http 모드에는 --endpoint 가 필요합니다.")
+    if args.replay and not args.cache:
+        parser.error("--replay 에는 --cache 가 필요합니다.")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = run(CRAWLERS[args.university](args), args)
+    if not result["completed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
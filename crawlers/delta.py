@@ -0,0 +1,112 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+
+from output import read_lectures
+
+# ==========================================
+# 🔀 이전 크롤링 결과와 비교해서 바뀐 강의만 뽑기 (delta)
+# ==========================================
+# 수강신청 기간엔 자주 다시 긁지만 대부분의 행은 그대로입니다.
+# 강의마다 내용 해시를 만들어 이전 스냅샷과 비교하고, 추가/삭제/변경된 것만 작은 파일로 씁니다.
+#
+# 강의 키 = (id, 같은 id 안에서 몇 번째인지)
+#   - 고려대 id(course_id-section)는 원래 유일 → 항상 1번째
+#   - 한양대 id(haksuNo)는 분반마다 반복됨 → LectureDataLoader 가 붙이는 "-01, -02" 순번과 같은 기준
+
+DELTA_SUFFIX = ".delta.json"
+
+def delta_path(snapshot_file):
+    base = snapshot_file[:-len(".json")] if snapshot_file.endswith(".json") else snapshot_file
+    return base + DELTA_SUFFIX
+
+def lecture_hash(lecture):
+    canonical = json.dumps(lecture, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+def keyed(lectures):
+    seen = {}
+    for lecture in lectures:
+        occurrence = seen.get(lecture["id"], 0) + 1
+        seen[lecture["id"]] = occurrence
+        yield (lecture["id"], occurrence), lecture
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# 이전 결과는 (키 → 해시) 만 기억하고, 새 결과는 한 줄씩 흘려보내며 비교
+def compute_delta(old_lectures, new_lectures):
+    old_hashes = {key: lecture_hash(lecture) for key, lecture in keyed(old_lectures)}
+    added, modified = [], []
+    for key, lecture in keyed(new_lectures):
+        old = old_hashes.pop(key, None)
+        if old is None:
+            added.append({"occurrence": key[1], "lecture": lecture})
+        elif old != lecture_hash(lecture):
+            modified.append({"occurrence": key[1], "lecture": lecture})
+    removed = [{"id": lecture_id, "occurrence": occurrence} for lecture_id, occurrence in old_hashes]
+    return {"added": added, "removed": removed, "modified": modified}
+
+def write_delta(previous_file, snapshot_file, out_file=None):
+    delta = compute_delta(read_lectures(previous_file), read_lectures(snapshot_file))
+    # 적용할 때 엉뚱한 기준 파일에 덮어쓰지 않도록 양쪽 원본 해시를 같이 기록
+    delta = {"from": file_hash(previous_file), "to": file_hash(snapshot_file), **delta}
+    out_file = out_file or delta_path(snapshot_file)
+    with open(out_file, "w", encoding="utf-8") as f:
+        json.dump(delta, f, ensure_ascii=False, separators=(",", ":"))
+    print(f"🔀 delta 저장: {out_file} (추가 {len(delta['added'])}, 삭제 {len(delta['removed'])}, 변경 {len(delta['modified'])})")
+    return delta
+
+# --previous 가 이번에 덮어쓸 출력 파일 자신이면 크롤링 전에 따로 복사해 둠
+def stash_previous(previous_file, output_file):
+    if os.path.exists(output_file) and os.path.abspath(previous_file) == os.path.abspath(output_file):
+        stashed = output_file + ".previous"
+        shutil.copyfile(previous_file, stashed)
+        return stashed
+    return previous_file
+
+# 이전 스냅샷 + delta → 새 스냅샷과 같은 (키 → 내용). 순서는 기존 순서 유지 후 추가분을 뒤에 붙임
+def apply_delta(old_lectures, delta):
+    removed = {(item["id"], item["occurrence"]) for item in delta["removed"]}
+    modified = {(item["lecture"]["id"], item["occurrence"]): item["lecture"] for item in delta["modified"]}
+    result = []
+    for key, lecture in keyed(old_lectures):
+        if key in removed: continue
+        result.append(modified.get(key, lecture))
+    result.extend(item["lecture"] for item in delta["added"])
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과 delta 계산/적용")
+    sub = parser.add_subparsers(dest="command", required=True)
+    diff = sub.add_parser("diff", help="이전 결과와 새 결과 비교")
+    diff.add_argument("previous")
+    diff.add_argument("snapshot")
+    diff.add_argument("-o", "--out", help=f"출력 파일 (기본: 스냅샷 옆 *{DELTA_SUFFIX})")
+    apply = sub.add_parser("apply", help="이전 결과에 delta 적용")
+    apply.add_argument("previous")
+    apply.add_argument("delta")
+    apply.add_argument("-o", "--out", required=True)
+    args = parser.parse_args()
+
+    if args.command == "diff":
+        write_delta(args.previous, args.snapshot, args.out)
+        return
+
+    with open(args.delta, "r", encoding="utf-8") as f:
+        delta = json.load(f)
+    if file_hash(args.previous) != delta["from"]:
+        parser.error("delta 의 기준 파일과 previous 가 다릅니다.")
+    lectures = apply_delta(read_lectures(args.previous), delta)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(lectures, f, ensure_ascii=False, indent=4)
+    print(f"📂 적용 완료: {args.out} (총 {len(lectures)}개 강의)")
+
+if __name__ == "__main__":
+    main()
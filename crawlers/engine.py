@@ -0,0 +1,475 @@
+import functools
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.util import Finalize
+
+from browser import BrowserPool, SessionLost, check_health, launch_headless
+from cache import CacheMiss, ResponseCache, cache_key
+from limiter import AdaptiveLimiter, retry
+from http_fetch import fetch, load_endpoint, make_session, rebase, session_from_driver
+from checkpoint import checkpoint_path, clear_checkpoint, load_checkpoint, save_checkpoint
+from output import LectureWriter, ndjson_path, ndjson_to_json, read_ndjson
+from delta import stash_previous, write_delta
+from export import export_all
+from search_index import build_index
+from validate import print_report, quality_path, validate_file, write_report
+from instrument import METRICS, report_path
+
+# --year/--semester 를 안 주면 결과의 year/semester 값과 파일 이름에 쓰는 학기 (서버가 지금 읽는 결과 파일에 적힌 값)
+# 이때 포털 화면의 학기는 건드리지 않음
+DEFAULT_YEAR = 2025
+DEFAULT_SEMESTER = 1
+
+# ==========================================
+# 🏫 학교별 크롤러 인터페이스
+# ==========================================
+# 학교마다 다른 건 "무엇을 조회하고(queries) → 어떻게 가져와서(fetch) → 어떻게 읽는지(parse)" 뿐이고
+# 병렬 처리, HTTP 세션, 체크포인트/이어하기, NDJSON 출력, delta, 계측은 전부 아래 엔진이 맡습니다.
+# 새 학교 = UniversityCrawler 하위 클래스 하나 + @register
+#
+#   query : 조회 한 번의 단위 (고려대 = 드롭다운 조합 dict, 한양대 = 페이지 번호). JSON 으로 저장 가능해야 함
+#   raw   : fetch 결과 (HTML 문자열, 행 목록 등 parse 가 읽을 수 있는 것). None 이면 '더 이상 없음'
+class UniversityCrawler:
+    name = None             # 레지스트리 키 (예: "KOREA")
+    title = ""              # 로그용 이름
+    output_file = None      # 기본 학기 결과 파일 (서버가 읽는 이름). 다른 학기는 term_output_file()
+    checkpoint_every = 20   # 조회 N번마다 체크포인트
+    dedup = True            # id 가 같은 강의는 처음 것만 (조회 순서 기준)
+    sequential = False      # 페이지 넘기기처럼 순서대로만 돌 수 있으면 True → 병렬 안 함, fetch 가 None 주면 종료
+    max_uses = 200          # 브라우저 하나로 조회 N번 하면 새 브라우저로 교체 (None 이면 죽었을 때만 교체)
+    clone_session = True    # 메인 브라우저의 url/쿠키만 옮긴 새 크롬(new_browser)으로 같은 조회가 되면 True
+                            # → 브라우저 병렬(헤드리스 여러 개)과 죽은 창 교체에 씀. False 면 메인 브라우저 하나로만
+
+    def __init__(self, args):
+        self.args = args
+        self.year = getattr(args, "year", None) or DEFAULT_YEAR
+        self.semester = getattr(args, "semester", None) or DEFAULT_SEMESTER
+        # --year/--semester 를 직접 줬을 때만 포털 화면의 학기를 바꿈 (안 주면 화면에 떠 있는 기본 학기 그대로)
+        self.term_given = getattr(args, "year", None) is not None or getattr(args, "semester", None) is not None
+
+    # --- 학기 ---
+    # 캐시 키 / 저장해 둔 조회 목록을 학기별로 구분하는 이름
+    @property
+    def term(self):
+        return f"{self.name}:{self.year}-{self.semester}"
+
+    # 포털에 넘길 연도/학기 값 (학교마다 표기가 다르면 오버라이드)
+    def term_values(self):
+        return {"year": str(self.year), "semester": str(self.semester)}
+
+    # 브라우저 화면에서 연도/학기 선택 (term_given 일 때만 조회 목록 탐색 / 조회 전에 엔진이 호출)
+    # 원하는 옵션이 없으면 경고만 남기고 화면 기본값으로 진행할 것 (크롤링 전체를 멈추지 않음)
+    def select_term(self, driver):
+        pass
+
+    # --output > 기본 학기면 학교 기본 파일 > real_lectures_{학교}_{연도}_{학기}.json
+    def term_output_file(self):
+        if getattr(self.args, "output", None):
+            return self.args.output
+        if (self.year, self.semester) == (DEFAULT_YEAR, DEFAULT_SEMESTER) and self.output_file:
+            return self.output_file
+        return f"real_lectures_{self.name.lower()}_{self.year}_{self.semester}.json"
+
+    # --- 조회 목록 ---
+    # 브라우저 없이 알 수 있으면 여기서 (저장해둔 조합 파일, 페이지 번호 등). 모르면 None
+    def preset_queries(self):
+        return None
+
+    # 브라우저 화면을 돌면서 조회 목록 만들기
+    def enumerate_queries(self, driver):
+        raise NotImplementedError
+
+    def query_key(self, query):
+        return str(query)
+
+    # 응답 캐시 키에 들어갈 조회 파라미터
+    def cache_params(self, query):
+        return query if isinstance(query, dict) else {"query": query}
+
+    # --- 브라우저 ---
+    def open_browser(self):
+        raise NotImplementedError
+
+    # 풀에서 새로 띄우는 브라우저 (병렬 워커 / 죽은 브라우저 교체용). 메인 브라우저의 url/쿠키를 이어받음
+    def new_browser(self, url, cookies):
+        return launch_headless(url, cookies)
+
+    def close_browser(self, driver):
+        driver.quit()
+
+    # --- 조회 1번 ---
+    # 브라우저 모드
+    def fetch(self, driver, query):
+        raise NotImplementedError
+
+    # HTTP 모드: 엔드포인트 기본 파라미터에 덧붙일 값 / 응답 본문 → raw
+    def request_params(self, query, endpoint):
+        raise NotImplementedError
+
+    def read_response(self, query, text):
+        return text
+
+    # raw → 강의 dict 목록
+    def parse(self, query, raw):
+        raise NotImplementedError
+
+# ==========================================
+# 📇 레지스트리
+# ==========================================
+CRAWLERS = {}
+
+def register(cls):
+    CRAWLERS[cls.name] = cls
+    return cls
+
+# ==========================================
+# ⚙️ 조회 실행 (fetch → parse, 계측 포함)
+# ==========================================
+def run_query(crawler, query, fetch_raw):
+    key = crawler.query_key(query)
+    with METRICS.query(key) as info:
+        try:
+            with METRICS.stage("fetch"):
+                raw = fetch_raw(query)
+        except Exception as e:
+            METRICS.error("fetch", e)
+            # 순서대로 넘기는 크롤러는 한 번 실패하면 뒤도 못 가므로 그대로 올려서 체크포인트 남기고 종료
+            # 세션을 잃은 경우도 뒤 조회가 전부 실패하므로 마찬가지
+            if crawler.sequential or isinstance(e, SessionLost):
+                raise
+            print(f"      ❌ 조회 중 에러 ({key}): {e}")
+            return []
+        if raw is None:
+            return None
+        with METRICS.stage("parse"):
+            lectures = crawler.parse(query, raw)
+        info["rows"] = len(lectures)
+    return lectures
+
+# 캐시에 있으면 그걸로, 없으면 가져와서 저장 (None = '더 이상 없음' 도 그대로 저장)
+# replay=True 면 가져오지 않고 오래된 캐시라도 씀. 없으면 CacheMiss
+def cached_fetch(crawler, cache, fetch_raw, replay=False):
+    def fetch_with_cache(query):
+        key = cache_key(crawler.term, crawler.cache_params(query))
+        try:
+            raw = json.loads(cache.get(key, ignore_ttl=replay))
+            METRICS.count("cache_hit")
+            return raw
+        except CacheMiss:
+            METRICS.count("cache_miss")
+            if replay:
+                raise
+        raw = fetch_raw(query)
+        cache.put(key, json.dumps(raw, ensure_ascii=False), crawler.name, query)
+        return raw
+    return fetch_with_cache
+
+# 요청 한 번 = 리미터 자리 하나. 일시적인 에러는 지터 백오프로 재시도 (재시도도 자리를 다시 받음)
+def resilient_fetch(fetch_raw, limiter, attempts):
+    def attempt(query):
+        with limiter.slot():
+            return fetch_raw(query)
+    return lambda query: retry(lambda: attempt(query), attempts)
+
+# 엔드포인트 JSON 에 year_param / semester_param 이 있고 --year/--semester 를 줬으면 학기 값도 같이 보냄
+def term_params(crawler, endpoint):
+    if not crawler.term_given:
+        return {}
+    values = crawler.term_values()
+    return {endpoint[f"{key}_param"]: value for key, value in values.items() if f"{key}_param" in endpoint}
+
+def http_get(crawler, session, endpoint, query, base_url=None, record_dir=None):
+    params = {**endpoint["params"], **term_params(crawler, endpoint), **crawler.request_params(query, endpoint)}
+    text = fetch(session, endpoint["method"], rebase(endpoint["url"], base_url), params, record_dir)
+    return crawler.read_response(query, text)
+
+def apply_term(crawler, driver):
+    if crawler.term_given:
+        crawler.select_term(driver)
+
+# 풀에서 새로 띄우는 브라우저도 같은 학기로 맞춰둠
+def term_browser(crawler, url, cookies):
+    driver = crawler.new_browser(url, cookies)
+    apply_term(crawler, driver)
+    return driver
+
+# ==========================================
+# 🧵 병렬 워커 (프로세스마다 헤드리스 크롬 1개)
+# ==========================================
+_worker = None
+
+def pooled_fetch(crawler, pool):
+    def fetch_raw(query):
+        with pool.session() as driver:
+            return crawler.fetch(driver, query)
+    return fetch_raw
+
+# 워커마다 브라우저 풀(1개)을 두고 시작하자마자 띄워둠 → 죽거나 오래 쓴 브라우저는 풀이 알아서 교체
+# 브라우저 하나는 한 번에 조회 하나뿐이라 워커별 리미터는 요청 간격만 조절함
+# setup = (crawler, cache, options): 학기마다 바뀌는 것. 조회와 같이 넘어오고, 학기가 바뀌면 _switch_term 이 맞춰줌
+def _init_worker(url, cookies, setup):
+    global _worker
+    crawler, _, options = setup
+    _worker = {"crawler": crawler}
+    pool = BrowserPool(lambda: term_browser(_worker["crawler"], url, cookies), max_uses=options["max_uses"])
+    pool.warm()
+    # 워커 프로세스가 정상 종료될 때 크롬도 같이 닫기
+    Finalize(pool, pool.close, exitpriority=10)
+    _worker["pool"] = pool
+    _switch_term(setup)
+
+# batch 에서 다음 학기에 같은 워커를 다시 쓰면: 떠 있는 크롬은 그대로 두고 화면의 학기만 다시 고름
+def _switch_term(setup):
+    crawler, cache, options = setup
+    if _worker.get("term") == crawler.term:
+        return
+    pool = _worker["pool"]
+    if "term" in _worker:
+        pool.refresh(lambda driver: apply_term(crawler, driver))
+    limiter = AdaptiveLimiter(1, min_interval=options["min_interval"])
+    fetch_raw = resilient_fetch(pooled_fetch(crawler, pool), limiter, options["attempts"])
+    _worker.update(crawler=crawler, term=crawler.term, fetch_raw=cached_fetch(crawler, cache, fetch_raw) if cache else fetch_raw)
+
+# 결과와 함께 이 워커의 계측 기록도 돌려줌 (메인 프로세스에서 합침)
+def _run_in_worker(setup, query):
+    _switch_term(setup)
+    lectures = run_query(_worker["crawler"], query, _worker["fetch_raw"])
+    return lectures, METRICS.drain()
+
+# executor.map 처럼 입력 순서대로 결과를 주되, 한 번에 window 개까지만 미리 제출
+# (map 은 전부 한꺼번에 제출하므로 받는 쪽이 중간에 죽어도 남은 조회가 다 끝나야 with 블록을 빠져나감)
+def ordered_map(executor, fn, items, window):
+    pending = deque()
+    items = iter(items)
+    try:
+        for item in itertools.islice(items, window):
+            pending.append(executor.submit(fn, item))
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(fn, item))
+            yield result
+    finally:
+        # 에러 / Ctrl-C / 소비 중단: 아직 시작 안 한 조회는 취소 → 체크포인트를 바로 남길 수 있음
+        for future in pending:
+            future.cancel()
+
+# shared 를 주면 (batch.py 의 학교 하나) 워커 프로세스와 그 안의 크롬을 shared["shards"] 에 두고 다음 학기에도 씀
+# → 닫는 건 shared 를 만든 쪽 (close_shards). 중간에 죽은 풀은 다음 학기에 새로 띄움
+def crawl_sharded(crawler, driver, queries, workers, cache, options, shared=None):
+    setup = (crawler, cache, options)
+    executor = shared.get("shards") if shared is not None else None
+    if executor is None:
+        print(f"🧵 헤드리스 크롬 {workers}개로 병렬 수집 시작...")
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(driver.current_url, driver.get_cookies(), setup))
+        if shared is not None: shared["shards"] = executor
+    else:
+        print(f"🧵 이전 학기에 띄운 헤드리스 크롬 {workers}개로 이어서 병렬 수집...")
+
+    # 조회 단위로 작업을 나눠주면 빨리 끝난 워커가 다음 조회를 가져가므로 자연스럽게 부하가 분산됨
+    # 결과는 입력 순서대로 받으므로 병합 순서도 보장됨
+    finished = False
+    try:
+        for lectures, metrics in ordered_map(executor, functools.partial(_run_in_worker, setup), queries, workers * 2):
+            METRICS.merge(metrics)
+            yield lectures
+        finished = True
+    finally:
+        if shared is None or not finished:
+            if shared is not None: shared.pop("shards", None)
+            executor.shutdown(cancel_futures=True)
+
+def close_shards(shared):
+    executor = shared.pop("shards", None)
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+
+# 쿠키를 옮긴 새 크롬으로 메인 브라우저를 대신해도 되는지 (학교 기본값, --clone-session 으로 강제)
+def can_clone(crawler, args):
+    return crawler.clone_session or getattr(args, "clone_session", False)
+
+# 조회별 강의 목록을 조회 순서대로 (캐시 재생 / HTTP / 병렬 / 순차)
+def crawl_queries(crawler, driver, queries, args, cache=None, shared=None):
+    parallel = args.workers > 1 and not crawler.sequential
+    max_uses = crawler.max_uses if args.recycle_after is None else (args.recycle_after or None)
+    attempts = args.retries + 1
+    # HTTP 병렬 모드는 동시 요청 수까지 조절 (최대 --workers), 나머지는 한 번에 하나라 간격만
+    limiter = AdaptiveLimiter(args.workers if parallel and args.http else 1, min_interval=args.min_interval)
+    with_cache = lambda fetch_raw: cached_fetch(crawler, cache, fetch_raw) if cache else fetch_raw
+    guarded = lambda fetch_raw: with_cache(resilient_fetch(fetch_raw, limiter, attempts))
+    pool = None
+    if args.replay:
+        print("📼 캐시 재생 모드 (네트워크/브라우저 없이 파싱만 다시)")
+        fetch_raw = cached_fetch(crawler, cache, None, replay=True)
+    elif args.http:
+        print(f"🌐 HTTP 직접 요청 모드 (동시 요청 {args.workers if parallel else 1}개)")
+        session = session_from_driver(driver, args.workers) if driver else make_session(args.workers)
+        endpoint = load_endpoint(args.endpoint)
+        fetch_raw = guarded(lambda query: http_get(crawler, session, endpoint, query, args.base_url, args.record))
+        if parallel:
+            # 네트워크 대기가 대부분이라 스레드로 충분 (Session 의 커넥션 풀을 공유)
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                yield from ordered_map(executor, lambda query: run_query(crawler, query, fetch_raw), queries, args.workers * 2)
+            return
+    elif parallel and can_clone(crawler, args):
+        options = {"max_uses": max_uses, "attempts": attempts, "min_interval": args.min_interval}
+        yield from crawl_sharded(crawler, driver, queries, args.workers, cache, options, shared)
+        return
+    else:
+        if parallel:
+            print(f"⚠️ {crawler.title}: 쿠키를 옮긴 헤드리스 크롬으로는 조회가 되는지 확인되지 않아 병렬 대신 순차로 수집합니다."
+                  " (병렬은 --http, 또는 확인했다면 --clone-session)")
+        # 메인 브라우저(사람이 연 창일 수 있음)를 계속 쓰고, 죽었을 때만 같은 세션을 이어받은 새 브라우저로
+        # 세션을 옮길 수 없는 학교(고려대 디버깅 크롬)는 대신 띄우지 않고 에러로 멈춤 → 다시 로그인 후 --resume
+        url, cookies = driver.current_url, driver.get_cookies()
+        if can_clone(crawler, args):
+            factory = lambda: term_browser(crawler, url, cookies)
+        else:
+            def factory():
+                raise SessionLost(f"{crawler.title} 브라우저 세션이 끊겼습니다. 크롬을 다시 열어 로그인한 뒤 --resume 으로 이어서 수집하세요.")
+        pool = BrowserPool(factory, max_uses=max_uses, seed=[driver])
+        fetch_raw = guarded(pooled_fetch(crawler, pool))
+
+    try:
+        for query in queries:
+            yield run_query(crawler, query, fetch_raw)
+    finally:
+        if pool is not None:
+            pool.close()
+
+def save_queries(queries, record_dir):
+    os.makedirs(record_dir, exist_ok=True)
+    with open(os.path.join(record_dir, 'queries.json'), 'w', encoding='utf-8') as f:
+        json.dump(queries, f, ensure_ascii=False, indent=4)
+
+# 스트리밍으로 쌓아둔 NDJSON → 서버가 읽는 JSON 배열 파일
+def save_to_json(stream_file, filename):
+    with METRICS.stage("json_dump"):
+        count = ndjson_to_json(stream_file, filename)
+    print(f"\n📂 저장 완료: {filename} (총 {count}개 강의)")
+    return count
+
+# ==========================================
+# 🕷️ 전체 실행
+# ==========================================
+# shared: 여러 학기를 이어서 돌릴 때 브라우저를 넘겨 쓰는 자리 ({"driver": ..., "shards": ...}, batch.py).
+#         주면 메인 브라우저와 병렬 워커(헤드리스 크롬)를 여기 두고 닫지 않음 → 다 쓰면 close_shards
+# 돌려주는 값: {"output", "completed", "rows"} (rows = 저장한 강의 수, 저장 안 했으면 None)
+# 중간에 죽으면 체크포인트만 남기고 예외를 그대로 올림
+def run(crawler, args, shared=None):
+    print(f"🚀 {crawler.title} {crawler.year}년 {crawler.semester}학기 크롤러 시작...")
+    output_file = crawler.term_output_file()
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    checkpoint_file = checkpoint_path(output_file)
+    every = args.checkpoint_every or crawler.checkpoint_every
+    stream_file = ndjson_path(output_file, args.gzip)
+    previous = stash_previous(args.previous, output_file) if args.previous else None
+    cache = ResponseCache(args.cache, args.cache_ttl * 3600, int(args.cache_max_mb * 1024 * 1024)) if args.cache else None
+
+    queries = None
+    done = 0 # 처리 끝낸 조회 개수
+    written = 0 # done 시점까지 NDJSON 에 쓴 줄 수
+    unique_ids = set() # 중복 방지
+    last_page = None # 순서대로 넘기는 크롤러의 직전 조회 결과 (마지막 페이지 반복 감지)
+
+    # 이어하기: 조회 목록/위치/지금까지 쓴 줄 수를 복원 (조회 순서가 같아야 결과도 같음)
+    state = load_checkpoint(checkpoint_file) if args.resume else None
+    writer = LectureWriter(stream_file, compact=args.compact, keep=state["written"] if state else None)
+    if state:
+        queries, done, written = state.get("queries", state.get("combos")), state["position"], state["written"]
+        last_page = state.get("last_page")
+        if crawler.dedup:
+            unique_ids.update(lecture["id"] for lecture in read_ndjson(stream_file))
+
+    driver = None
+    completed = False
+    rows = None
+    try:
+        if queries is None:
+            queries = crawler.preset_queries()
+        if queries is None and args.replay:
+            queries = cache.load_queries(crawler.term)
+            if queries is None:
+                raise SystemExit(f"캐시에 {crawler.term} 조회 목록이 없습니다: {args.cache}")
+
+        # 캐시 재생이거나, 스텁 서버 재생처럼 조회 목록과 접속지가 모두 주어지면 브라우저 없이 바로 진행
+        if not args.replay and not (args.http and args.base_url and queries is not None):
+            driver = shared.get("driver") if shared else None
+            if driver is not None and check_health(driver) == "crashed":
+                driver = None
+            if driver is None:
+                driver = crawler.open_browser()
+                if shared is not None: shared["driver"] = driver
+            apply_term(crawler, driver)
+
+        if queries is None:
+            with METRICS.stage("enumerate"):
+                queries = crawler.enumerate_queries(driver)
+        # 목록으로 정해진 조회만 체크포인트/녹화에 저장 (페이지 번호처럼 끝없는 건 위치만으로 충분)
+        saved = queries if isinstance(queries, list) else None
+        if args.record and saved is not None:
+            save_queries(saved, args.record)
+        if cache and saved is not None and not args.replay:
+            cache.save_queries(crawler.term, saved)
+
+        # 이미 끝낸 조회는 건너뜀
+        for lectures in crawl_queries(crawler, driver, itertools.islice(queries, done, None), args, cache, shared):
+            if lectures is None: break # 마지막 페이지 지남
+            # 마지막 페이지를 계속 돌려주는 포털 → 종료. 응답을 읽는 단계가 아니라 파싱한 결과로 비교해야
+            # 캐시에서 꺼낸 페이지(응답을 다시 읽지 않음)든 새로 받은 페이지든 똑같이 판단됨
+            if crawler.sequential:
+                if lectures and lectures == last_page:
+                    print("\n🎉 직전 조회와 같은 결과 (마지막 페이지 반복). 종료!")
+                    break
+                last_page = lectures
+            with METRICS.stage("write"):
+                for lecture in lectures:
+                    if crawler.dedup:
+                        if lecture["id"] in unique_ids: continue # 중복 제거
+                        unique_ids.add(lecture["id"])
+                    writer.write(lecture)
+            done, written = done + 1, writer.count
+            if done % every == 0:
+                writer.flush()
+                save_checkpoint(checkpoint_file, {"position": done, "written": written, "queries": saved, "last_page": last_page})
+
+        clear_checkpoint(checkpoint_file)
+        completed = True
+    except BaseException:
+        # 죽기 직전까지 끝낸 조회는 남겨둠 → --resume 으로 이어서
+        # (수집 도중 끊긴 조회의 일부 행은 이어할 때 잘라내므로 중복이 안 생김)
+        # 저장만 하고 예외는 그대로 올림 (Ctrl-C/SystemExit 를 삼키면 실패한 크롤링이 성공처럼 끝남)
+        if queries is not None:
+            save_checkpoint(checkpoint_file, {"position": done, "written": written,
+                                              "queries": queries if isinstance(queries, list) else None, "last_page": last_page})
+            print(f"\n💾 체크포인트 저장 ({done}번째 조회까지). --resume 으로 이어서 수집할 수 있습니다.")
+        raise
+    finally:
+        writer.close()
+        # 끝까지 수집한 결과만 검증/정리 (중간에 끊긴 NDJSON 은 이어하기 때문에 그대로 둬야 함)
+        if completed and args.validate:
+            with METRICS.stage("validate"):
+                quality = validate_file(stream_file, crawler.name, drop_duplicates=args.drop_duplicates, compact=args.compact)
+            print_report(quality)
+            write_report(quality, quality_path(output_file))
+        # 끝까지 수집한 경우에만 서버가 읽는 JSON 배열 파일을 씀 (중간에 죽으면 기존 결과 파일을 그대로 두고,
+        # 지금까지 모은 것은 NDJSON + 체크포인트에 남겨서 --resume 으로 이어감)
+        if completed:
+            rows = save_to_json(stream_file, output_file)
+            if args.sqlite or args.parquet:
+                with METRICS.stage("export"):
+                    export_all(stream_file, crawler.name, args.sqlite, args.parquet)
+            if args.search_index:
+                with METRICS.stage("search_index"):
+                    build_index(stream_file, args.search_index, crawler.name)
+        # 끝까지 수집한 경우에만 delta 계산 (중간에 죽은 결과와 비교하면 전부 '삭제'로 나옴)
+        if previous and completed:
+            write_delta(previous, output_file)
+        if driver is not None and shared is None:
+            crawler.close_browser(driver)
+        METRICS.write_report(report_path(output_file))
+    return {"output": output_file, "completed": completed, "rows": rows}
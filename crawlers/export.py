@@ -0,0 +1,201 @@
+import argparse
+import os
+import sqlite3
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError: # 없으면 Parquet 만 못 씀
+    pa = None
+
+from bitmask import from_hex, slots_mask, to_hex
+from output import guess_university, read_lectures, with_section_ids
+from timeslots import parse_slots
+
+# ==========================================
+# 🗃️ 크롤링 결과 → SQLite / Parquet (열 단위, 인덱스 포함)
+# ==========================================
+# 서버는 부팅할 때마다 1.5 MB 짜리 JSON 배열을 통째로 읽고 한 줄씩 INSERT 합니다.
+# 같은 결과를 바로 조회할 수 있는 형태로도 저장해 두면 읽기/검색/분석에 JSON 파싱이 필요 없음.
+#   - 반복되는 문자열(대학/학과/이수구분)은 사전 테이블로 빼고 강의에는 번호만 (dictionary encoding)
+#   - 시간 슬롯은 파싱해 둔 것을 slots 테이블로 (결과에 없으면 timeRoom 을 여기서 파싱)
+#   - id / name / professor / college 에 인덱스
+# SQLite 는 표준 라이브러리라 항상 가능, Parquet 은 pyarrow 가 있을 때만.
+#
+#   python export.py real_lectures_korea_2026_1.json --sqlite lectures.sqlite --parquet lectures.parquet
+#   sqlite3 lectures.sqlite "SELECT name, professor FROM lecture_view WHERE college = '간호대학'"
+
+DICTIONARIES = ["college", "department", "category"]
+
+SCHEMA = """
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE college (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE department (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE category (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE lecture (
+    seq INTEGER PRIMARY KEY,  -- 결과 파일 안 순서 (0부터)
+    id TEXT NOT NULL,         -- 서버와 같은 분반 id (한양대는 학수번호-01, -02 ... export_all 에서 붙임)
+    name TEXT NOT NULL,
+    professor TEXT,
+    credit REAL,
+    time_room TEXT,
+    category_id INTEGER REFERENCES category (id),
+    college_id INTEGER REFERENCES college (id),
+    department_id INTEGER REFERENCES department (id),
+    details TEXT,
+    year INTEGER,
+    semester INTEGER,
+    week_mask BLOB            -- 주간 비트마스크 (big-endian 바이트, lecture_view 에서는 weekMask 와 같은 16진수)
+);
+CREATE TABLE slot (
+    lecture_seq INTEGER NOT NULL REFERENCES lecture (seq),
+    day TEXT NOT NULL,
+    start INTEGER NOT NULL,   -- 00:00 부터 흐른 분
+    "end" INTEGER NOT NULL,
+    room TEXT
+);
+"""
+
+# 데이터를 다 넣은 뒤에 만들어야 빠름
+INDEXES = """
+CREATE INDEX lecture_id ON lecture (id);
+CREATE INDEX lecture_name ON lecture (name);
+CREATE INDEX lecture_professor ON lecture (professor);
+CREATE INDEX lecture_college ON lecture (college_id);
+CREATE INDEX slot_lecture ON slot (lecture_seq);
+CREATE INDEX slot_day ON slot (day, start);
+CREATE VIEW lecture_view AS
+    SELECT lecture.seq, lecture.id, lecture.name, lecture.professor, lecture.credit, lecture.time_room AS timeRoom,
+           category.name AS category, college.name AS college, department.name AS department,
+           lecture.details, lecture.year, lecture.semester, coalesce(nullif(ltrim(lower(hex(lecture.week_mask)), '0'), ''), '0') AS weekMask
+    FROM lecture
+    LEFT JOIN category ON category.id = lecture.category_id
+    LEFT JOIN college ON college.id = lecture.college_id
+    LEFT JOIN department ON department.id = lecture.department_id;
+"""
+
+# 결과 파일에 slots/weekMask 가 없으면 (예전 결과) 여기서 채움
+def with_slots(lectures, university):
+    for lecture in lectures:
+        if lecture.get("slots") is None:
+            if university is None:
+                raise ValueError("slots 가 없는 결과입니다. 학교(--university)를 지정하세요.")
+            lecture["slots"] = parse_slots(lecture.get("timeRoom", ""), university, lecture.get("name", ""))
+        if "weekMask" not in lecture:
+            lecture["weekMask"] = to_hex(slots_mask(lecture["slots"]))
+        yield lecture
+
+# ==========================================
+# 🪶 SQLite
+# ==========================================
+# 16진수 문자열 그대로면 강의당 수백 바이트 → 정수 바이트로
+def _mask_bytes(week_mask):
+    mask = from_hex(week_mask)
+    return mask.to_bytes((mask.bit_length() + 7) // 8, "big")
+
+# 임시 파일에 다 쓰고 마지막에 바꿔치기 → 읽는 쪽이 반쯤 쓴 파일을 볼 일이 없음
+def export_sqlite(lectures, path, university=None, batch_size=1000):
+    tmp_path = path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executescript(SCHEMA)
+
+    codes = {table: {} for table in DICTIONARIES}
+    def code(table, value):
+        if value is None: return None
+        known = codes[table]
+        if value not in known:
+            known[value] = len(known) + 1
+            conn.execute(f"INSERT INTO {table} (id, name) VALUES (?, ?)", (known[value], value))
+        return known[value]
+
+    rows, slot_rows = [], []
+    def flush():
+        conn.executemany("INSERT INTO lecture VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT INTO slot VALUES (?, ?, ?, ?, ?)", slot_rows)
+        rows.clear()
+        slot_rows.clear()
+
+    count = 0
+    for seq, lecture in enumerate(with_slots(lectures, university)):
+        rows.append((seq, lecture["id"], lecture["name"], lecture.get("professor"), lecture.get("credit"),
+                     lecture.get("timeRoom"), code("category", lecture.get("category")),
+                     code("college", lecture.get("college")), code("department", lecture.get("department")),
+                     lecture.get("details"), lecture.get("year"), lecture.get("semester"), _mask_bytes(lecture["weekMask"])))
+        slot_rows.extend((seq, slot["day"], slot["start"], slot["end"], slot.get("room")) for slot in lecture["slots"])
+        count += 1
+        if len(rows) >= batch_size:
+            flush()
+    flush()
+
+    conn.executescript(INDEXES)
+    conn.executemany("INSERT INTO meta VALUES (?, ?)", [("university", university or ""), ("lectures", str(count))])
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    os.replace(tmp_path, path)
+    return count
+
+# ==========================================
+# 🏹 Parquet (pyarrow)
+# ==========================================
+# 대학/학과/이수구분은 dictionary 타입 → pandas 로 읽으면 category 열, 파일 안에서도 사전 + 번호로 저장
+def _parquet_schema():
+    text = pa.string()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    slot = pa.struct([("day", dictionary), ("start", pa.int16()), ("end", pa.int16()), ("room", text)])
+    return pa.schema([
+        ("id", text), ("name", text), ("professor", text), ("credit", pa.float32()), ("timeRoom", text),
+        ("category", dictionary), ("college", dictionary), ("department", dictionary), ("details", text),
+        ("year", pa.int16()), ("semester", pa.int8()), ("slots", pa.list_(slot)), ("weekMask", text),
+    ])
+
+def export_parquet(lectures, path, university=None, batch_size=5000):
+    if pa is None:
+        raise ImportError("Parquet 으로 저장하려면 먼저 설치하세요: pip install pyarrow")
+    schema = _parquet_schema()
+    fields = schema.names
+    tmp_path = path + ".tmp"
+    count = 0
+    with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+        batch = []
+        for lecture in with_slots(lectures, university):
+            batch.append({field: lecture.get(field) for field in fields})
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    os.replace(tmp_path, path)
+    return count
+
+# 크롤러 출력 단계에서 호출 (결과 파일 하나를 읽어 원하는 형식으로)
+# 결과 파일의 id 는 포털 원본 (한양대는 학수번호만) → 서버/검색 인덱스와 같은 분반 id 로 바꿔서 저장
+def export_all(source, university=None, sqlite_path=None, parquet_path=None):
+    if sqlite_path:
+        count = export_sqlite(with_section_ids(read_lectures(source), university), sqlite_path, university)
+        print(f"🗃️ SQLite 저장: {sqlite_path} ({count}개 강의, {os.path.getsize(sqlite_path) / 1024:.0f} KB)")
+    if parquet_path:
+        count = export_parquet(with_section_ids(read_lectures(source), university), parquet_path, university)
+        print(f"🏹 Parquet 저장: {parquet_path} ({count}개 강의, {os.path.getsize(parquet_path) / 1024:.0f} KB)")
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과 → SQLite / Parquet")
+    parser.add_argument("source", help="결과 파일 (.json / .ndjson / .ndjson.gz)")
+    parser.add_argument("--sqlite", help="SQLite 출력 경로")
+    parser.add_argument("--parquet", help="Parquet 출력 경로 (pyarrow 필요)")
+    parser.add_argument("--university", choices=["KOREA", "HANYANG"], help="slots 가 없는 결과일 때 timeRoom 해석 기준 (기본: 파일 이름으로 추측)")
+    args = parser.parse_args()
+    if not args.sqlite and not args.parquet:
+        parser.error("--sqlite 나 --parquet 중 하나는 지정하세요.")
+
+    export_all(args.source, args.university or guess_university(args.source), args.sqlite, args.parquet)
+    print(f"   (원본 {args.source}: {os.path.getsize(args.source) / 1024:.0f} KB)")
+
+if __name__ == "__main__":
+    main()
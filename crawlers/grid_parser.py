@@ -0,0 +1,163 @@
+import re
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError: # 없으면 해당 백엔드만 못 씀
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# ==========================================
+# 🧱 고려대 그리드 HTML 파서 백엔드
+# ==========================================
+# 예전에는 조회마다 page_source 전체를 BeautifulSoup(html.parser) 로 만들고 select 했는데
+# 화면 전체(메뉴, 스크립트, 드롭다운 옵션 수천 개)를 파싱하는 게 조회당 CPU 시간 대부분이었음.
+#   1) 문자열에서 #gridLecture 의 <tbody> 부분만 잘라내고 (grid_fragment)
+#   2) 그 조각만 백엔드로 파싱
+# 백엔드: "html.parser" (BeautifulSoup, 기본 설치) / "lxml" / "selectolax" (C 구현, 가장 빠름)
+# 어느 백엔드든 parse_grid_html 결과는 예전 방식과 글자 하나까지 같아야 함 (bench_grid_parser.py 로 확인)
+
+BACKENDS = ["selectolax", "lxml", "html.parser"]
+
+GRID_START = re.compile(r"""<[a-zA-Z][^>]*?\bid\s*=\s*["']?gridLecture["'\s/>]""")
+TBODY_OPEN = re.compile(r"<tbody\b[^>]*>", re.I)
+TBODY_CLOSE = re.compile(r"</tbody\s*>", re.I)
+TABLE_CLOSE = re.compile(r"</table\s*>", re.I)
+
+# #gridLecture > tbody 안쪽 HTML 을 <table><tbody> 로 감싸서 돌려줌
+#   - 그리드가 아예 없으면 None (XHR 응답이 행 조각만 온 경우 → 전체에서 tr 을 찾음)
+#   - 그리드는 있는데 tbody 가 없으면 "" (행 없음)
+def grid_fragment(html):
+    start = GRID_START.search(html)
+    if not start:
+        return None
+    table_end = TABLE_CLOSE.search(html, start.end())
+    end = table_end.start() if table_end else len(html)
+
+    bodies = []
+    position = start.end()
+    while True:
+        opened = TBODY_OPEN.search(html, position, end)
+        if not opened: break
+        closed = TBODY_CLOSE.search(html, opened.end(), end)
+        stop = closed.start() if closed else end
+        bodies.append(html[opened.end():stop])
+        position = closed.end() if closed else end
+    if not bodies:
+        return ""
+    return "<table><tbody>" + "</tbody><tbody>".join(bodies) + "</tbody></table>"
+
+# 행 조각만 있는 응답도 HTML5 파서가 tr 을 버리지 않도록 표로 감싸줌
+def _loose_rows_html(html):
+    return html if "<table" in html.lower() else "<table>" + html + "</table>"
+
+def _strings(texts):
+    stripped = (text.strip() for text in texts)
+    return [text for text in stripped if text]
+
+# ------------------------------------------
+# 백엔드 공통 모양
+#   rows(html)       → 행 노드 목록 (#gridLecture > tbody > tr, 그리드가 없으면 모든 tr)
+#   cells(row)       → 행 안의 td 목록 (하위 전체)
+#   strings(node)    → 공백 제거한 텍스트 조각들 (get_text(strip=True) 의 재료)
+#   text(node)       → 노드 전체 텍스트
+#   has_mooc(node)   → <span class="label-type">M</span> 이 있는지
+# ------------------------------------------
+class SoupBackend:
+    name = "html.parser"
+
+    def rows(self, html):
+        fragment = grid_fragment(html)
+        if fragment is None:
+            return BeautifulSoup(html, "html.parser").select("tr")
+        if not fragment:
+            return []
+        return BeautifulSoup(fragment, "html.parser").select("tbody > tr")
+
+    def cells(self, row):
+        return row.find_all("td")
+
+    def strings(self, node):
+        return _strings(node.strings)
+
+    def text(self, node):
+        return node.text
+
+    def has_mooc(self, node):
+        return node.find("span", class_="label-type", string="M") is not None
+
+class LxmlBackend:
+    name = "lxml"
+
+    def rows(self, html):
+        fragment = grid_fragment(html)
+        if fragment is None:
+            return lxml.html.fromstring(_loose_rows_html(html)).xpath("//tr")
+        if not fragment:
+            return []
+        return lxml.html.fromstring(fragment).xpath("./tbody/tr")
+
+    def cells(self, row):
+        return row.xpath(".//td")
+
+    def strings(self, node):
+        return _strings(node.xpath(".//text()"))
+
+    def text(self, node):
+        return "".join(node.xpath(".//text()"))
+
+    def has_mooc(self, node):
+        for span in node.iter("span"):
+            if "label-type" in (span.get("class") or "").split() and len(span) == 0 and span.text == "M":
+                return True
+        return False
+
+class SelectolaxBackend:
+    name = "selectolax"
+
+    def rows(self, html):
+        fragment = grid_fragment(html)
+        if fragment is None:
+            return LexborHTMLParser(_loose_rows_html(html)).css("tr")
+        if not fragment:
+            return []
+        return LexborHTMLParser(fragment).css("tbody > tr")
+
+    def cells(self, row):
+        return row.css("td")
+
+    def strings(self, node):
+        return _strings(child.text(deep=False) for child in node.traverse(include_text=True) if child.tag == "-text")
+
+    def text(self, node):
+        return node.text()
+
+    def has_mooc(self, node):
+        for span in node.css("span.label-type"):
+            children = list(span.iter(include_text=True))
+            if len(children) == 1 and children[0].tag == "-text" and children[0].text(deep=False) == "M":
+                return True
+        return False
+
+_AVAILABLE = {
+    "html.parser": lambda: True,
+    "lxml": lambda: lxml is not None,
+    "selectolax": lambda: LexborHTMLParser is not None,
+}
+_CLASSES = {"html.parser": SoupBackend, "lxml": LxmlBackend, "selectolax": SelectolaxBackend}
+
+def available_backends():
+    return [name for name in BACKENDS if _AVAILABLE[name]()]
+
+# name 이 None 이면 설치된 것 중 가장 빠른 것
+def get_backend(name=None):
+    if name is None:
+        name = available_backends()[0]
+    if not _AVAILABLE[name]():
+        raise ImportError(f"'{name}' 파서를 쓰려면 먼저 설치하세요: pip install {name}")
+    return _CLASSES[name]()
@@ -0,0 +1,304 @@
+import itertools
+import json
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from waits import snapshot_grid, wait_for_grid
+from http_fetch import find_rows
+from browser import launch_chrome
+from engine import DEFAULT_SEMESTER, DEFAULT_YEAR, UniversityCrawler, register
+from timeslots import parse_slots
+from bitmask import slots_mask, to_hex
+from instrument import METRICS
+from limiter import retry
+from validate import synthetic_id
+
+# 강의 행(td#gwamokNm)을 담고 있는 tbody
+GRID_TBODY = 'tbody:has(td[id="gwamokNm"])'
+PORTAL_URL = "https://portal.hanyang.ac.kr/sugang/sulg.do"
+OUTPUT_FILE = "real_lectures_hanyang_full.json"
+
+# 행에서 읽어오는 칸들 (td 의 id == 그리드 XHR 응답 JSON 의 키)
+CELL_IDS = ["gwamokNm", "haksuNo", "hakjeom", "suupTimes", "daepyoGangsaNm", "isuGbNm", "suupTypeGb"]
+
+# ==========================================
+# 🧩 행 → 강의 dict (브라우저 / HTTP 공통)
+# ==========================================
+# cells: {td id: 텍스트}. 해당 칸이 아예 없으면 키도 없음.
+def row_to_lecture(cells, year=DEFAULT_YEAR, semester=DEFAULT_SEMESTER):
+    name = cells["gwamokNm"].strip()
+    haksu_code = cells.get("haksuNo", "").strip()
+    credit = float(cells["hakjeom"].strip()) if "hakjeom" in cells else 0.0
+    time_room = cells.get("suupTimes", "").strip()
+    professor = cells["daepyoGangsaNm"].strip() if "daepyoGangsaNm" in cells else "미정"
+    isu_text = cells.get("isuGbNm", "").strip()
+    category = "전공" if "전공" in isu_text else ("교양" if "교양" in isu_text else "기타")
+    raw_details = cells.get("suupTypeGb", "").strip()
+
+    details = []
+    if raw_details: details.append(raw_details)
+    if "영강" in name: details.append("영강")
+
+    slots = parse_slots(time_room, "HANYANG")
+
+    lecture = {
+        "id": haksu_code,
+        "name": name,
+        "professor": professor,
+        "credit": credit,
+        "timeRoom": time_room,
+        "category": category,
+        "college": "한양대학",
+        "department": "전체",
+        "details": ",".join(details),
+        "year": year,
+        "semester": semester,
+        "slots": slots, # 분 단위 (day, start, end, room)
+        "weekMask": to_hex(slots_mask(slots)) # 5분 단위 주간 비트마스크 (충돌 검사용)
+    }
+    # 학수번호가 없으면 내용으로 만든 고정 id (페이지/순번으로 만들면 실행마다 바뀜)
+    if not haksu_code:
+        lecture["id"] = synthetic_id(lecture)
+    return lecture
+
+def collect_page(rows, year=DEFAULT_YEAR, semester=DEFAULT_SEMESTER):
+    lectures = []
+    for cells in rows:
+        try:
+            if "gwamokNm" not in cells: continue
+            lectures.append(row_to_lecture(cells, year, semester))
+        except Exception as e:
+            METRICS.error("parse_row", e)
+            continue
+    return lectures
+
+# ==========================================
+# 🖥️ 브라우저 모드
+# ==========================================
+# 페이지의 모든 행을 execute_script 한 번으로 뽑아옴
+# (행마다 find_elements × 7 + .text 왕복을 하면 페이지당 WebDriver RPC 가 수백 번)
+_EXTRACT_ROWS_JS = """
+var ids = arguments[0];
+var out = [];
+var rows = document.getElementsByTagName('tr');
+for (var i = 0; i < rows.length; i++) {
+    var cells = {};
+    var found = false;
+    for (var j = 0; j < ids.length; j++) {
+        var td = rows[i].querySelector('td[id="' + ids[j] + '"]');
+        if (td) { cells[ids[j]] = td.innerText; found = true; }
+    }
+    if (found) out.push(cells);
+}
+return out;
+"""
+
+def extract_rows(driver):
+    return driver.execute_script(_EXTRACT_ROWS_JS, CELL_IDS)
+
+# 예전 방식 (행/칸마다 WebDriver 호출) - bench_extract.py 비교용으로만 남겨둠
+def extract_rows_per_cell(driver):
+    rows = []
+    for row in driver.find_elements(By.TAG_NAME, "tr"):
+        try:
+            cells = {}
+            for cell_id in CELL_IDS:
+                elem = row.find_elements(By.CSS_SELECTOR, f'td[id="{cell_id}"]')
+                if elem: cells[cell_id] = elem[0].text
+            rows.append(cells)
+        except Exception as e:
+            METRICS.error("extract_row", e)
+            continue
+    return rows
+
+def open_portal(driver, wait):
+    # 1. 사이트 접속
+    with METRICS.stage("page_load"):
+        retry(lambda: driver.get(PORTAL_URL), label="page_load")
+
+    try:
+        print("🖱️ '수강편람' 메뉴 클릭...")
+        menu_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'a[title="수강편람"]')))
+        menu_btn.click()
+    except TimeoutException:
+        METRICS.count("menu_missing")
+        print("   (이미 수강편람 페이지일 수 있어 넘어갑니다)")
+
+# 연도/학기 드롭다운 (--year/--semester 를 줬을 때만 엔진이 호출)
+# 드롭다운 id 를 모르므로 옵션 글자로 찾음 ("2025", "1학기"). 못 찾으면 경고 후 화면 기본값
+def select_term(driver, year, semester):
+    wanted = {"year": lambda text: text.startswith(str(year)), "semester": lambda text: text.startswith(f"{semester}학기")}
+    for kind, matches in wanted.items():
+        for select_elem in driver.find_elements(By.TAG_NAME, "select"):
+            options = [option for option in Select(select_elem).options if matches(option.text.strip())]
+            if options:
+                if not options[0].is_selected():
+                    Select(select_elem).select_by_visible_text(options[0].text)
+                break
+        else:
+            METRICS.count("term_select_missing")
+            print(f"   ⚠️ {kind} 드롭다운을 찾지 못해 화면 기본값으로 진행")
+
+# 다음 페이지로 이동 성공하면 True, 마지막 페이지면 False
+def go_to_next_page(driver, wait, current_page):
+    # Case A: 10의 배수 페이지 (예: 10, 20...) -> '>' 버튼 클릭
+    if current_page % 10 == 0:
+        print(f"   🔄 현재 {current_page}페이지(10의 배수). 다음 목록(>) 이동 시도...")
+
+        expected_next_page = current_page + 1
+        next_btn_xpath = "//img[contains(@alt, '다음')]"
+
+        try:
+            # 1. 이미지 요소 찾기
+            next_img_btn = wait.until(EC.element_to_be_clickable((By.XPATH, next_btn_xpath)))
+            before = snapshot_grid(driver, GRID_TBODY)
+
+            # 2. 클릭 시도
+            try:
+                next_img_btn.click()
+            except WebDriverException: # 이미지 위에 다른 요소가 덮여 있으면 부모 <a> 를 스크립트로 클릭
+                parent_a = next_img_btn.find_element(By.XPATH, "./ancestor::a")
+                driver.execute_script("arguments[0].click();", parent_a)
+
+            print(f"   ⏳ 클릭 수행함. {expected_next_page}페이지가 뜰 때까지 대기...")
+
+            # 3. 페이지 번호 감지 (여기서 타임아웃 나면 진짜 끝인 것임)
+            wait.until(EC.presence_of_element_located(
+                (By.XPATH, f"//div[@id='pagingPanel']//*[contains(text(), '{expected_next_page}')]")
+            ))
+
+            print(f"   ✨ {expected_next_page}페이지 발견! 이동 성공.")
+            with METRICS.stage("wait"):
+                if not wait_for_grid(driver, GRID_TBODY, before):
+                    METRICS.count("grid_unchanged")
+            return True
+
+        except TimeoutException:
+            # 타임아웃 발생 시, 강제 진행하지 않고 종료합니다. (중복 수집 방지)
+            print(f"\n🎉 {expected_next_page}페이지가 나타나지 않습니다. (여기가 마지막 페이지입니다)")
+            return False
+        # 그 밖의 에러(세션 끊김 등)는 '마지막 페이지'로 착각하지 않도록 그대로 올림 → 엔진이 재시도
+    # Case B: 일반 페이지 -> 숫자 버튼 클릭
+    else:
+        next_page = current_page + 1
+        try:
+            # 숫자 버튼도 클릭 가능할 때까지 기다림
+            next_num_btn = wait.until(EC.element_to_be_clickable((By.XPATH, f"//a[text()='{next_page}']")))
+
+            print(f"➡️ {next_page}페이지로 이동합니다...")
+            before = snapshot_grid(driver, GRID_TBODY)
+            driver.execute_script("arguments[0].click();", next_num_btn)
+
+            with METRICS.stage("wait"):
+                if not wait_for_grid(driver, GRID_TBODY, before):
+                    METRICS.count("grid_unchanged")
+            return True
+        except TimeoutException:
+            print(f"\n🎉 다음 페이지 번호({next_page})를 찾을 수 없습니다. 종료!")
+            return False
+
+# ==========================================
+# 🌐 HTTP 모드: 페이지 버튼 대신 그리드 XHR 을 페이지 번호만 바꿔 직접 요청
+# ==========================================
+# JSON 값은 숫자/None 일 수 있으므로 화면 텍스트와 같은 문자열로 맞춰줌
+def json_row_to_cells(row):
+    return {key: ("" if row[key] is None else str(row[key])) for key in CELL_IDS if key in row}
+
+# ==========================================
+# 🕷️ 한양대 크롤러 (HTTP/이어하기/출력은 engine.py)
+# ==========================================
+# 조회 단위 = 페이지 번호. 페이지 버튼을 차례로 눌러야 하므로 순차 전용이고,
+# 다음 페이지가 없으면 fetch 가 None 을 돌려줘서 끝냄
+@register
+class HanyangCrawler(UniversityCrawler):
+    name = "HANYANG"
+    title = "한양대"
+    output_file = OUTPUT_FILE
+    checkpoint_every = 10
+    dedup = False
+    sequential = True
+    max_uses = None # 페이지 위치가 브라우저에 있으므로 일부러 교체하지는 않음 (죽었을 때만)
+
+    def __init__(self, args):
+        super().__init__(args)
+        self.driver = None
+        self.wait = None
+        self.current_page = None # 브라우저에 떠 있는 페이지 (조회 전이면 None)
+
+    def preset_queries(self):
+        return itertools.count(1)
+
+    def query_key(self, page):
+        return f"page {page}"
+
+    def cache_params(self, page):
+        return {"page": page}
+
+    def select_term(self, driver):
+        select_term(driver, self.year, self.semester)
+        self.current_page = None # 학기가 바뀌면 조회부터 다시
+
+    def open_browser(self):
+        return self.new_browser(None, None)
+
+    def new_browser(self, url, cookies):
+        driver = launch_chrome()
+        open_portal(driver, WebDriverWait(driver, 15))
+        return driver
+
+    def fetch(self, driver, page):
+        # 브라우저가 바뀌었으면 (처음 / 죽어서 교체) 조회부터 다시 하고 1페이지에서 목표 페이지까지 넘겨감
+        if driver is not self.driver:
+            self.driver = driver
+            self.wait = WebDriverWait(driver, 15) # 기본 대기 15초
+            self.current_page = None
+
+        if self.current_page is None:
+            # 2. 조회 시작
+            print("🖱️ '조회' 버튼 클릭!")
+            search_btn = self.wait.until(EC.element_to_be_clickable((By.ID, "btn_Find")))
+            before = snapshot_grid(driver, GRID_TBODY)
+            search_btn.click()
+            with METRICS.stage("wait"):
+                wait_for_grid(driver, GRID_TBODY, before, timeout=15)
+            self.current_page = 1
+
+        # 이어하기면 이미 수집한 페이지는 넘기기만 하고 추출은 건너뜀
+        while self.current_page < page:
+            with METRICS.stage("next_page"):
+                moved = go_to_next_page(driver, self.wait, self.current_page)
+            if not moved:
+                return None
+            self.current_page += 1
+
+        print(f"\n📄 {page}페이지 데이터 수집 중...")
+        try:
+            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "tr")))
+        except TimeoutException:
+            METRICS.count("table_timeout")
+            print("⚠️ 테이블 로딩 실패")
+
+        with METRICS.stage("extract"):
+            return extract_rows(driver)
+
+    def request_params(self, page, endpoint):
+        return {endpoint.get("page_param", "pageNo"): page}
+
+    def read_response(self, page, text):
+        rows = find_rows(json.loads(text), "gwamokNm")
+        # 빈 페이지 → 종료 (마지막 페이지를 계속 돌려주는 경우는 엔진이 직전 페이지와 비교해서 끝냄)
+        if not rows:
+            print(f"\n🎉 {page}페이지에 새 데이터가 없습니다. 종료!")
+            return None
+        return [json_row_to_cells(row) for row in rows]
+
+    def parse(self, page, rows):
+        lectures = collect_page(rows, self.year, self.semester)
+        print(f"   ✅ {page}페이지: {len(lectures)}개 수집 완료.")
+        return lectures
+
+if __name__ == "__main__":
+    import sys
+    from crawl import main
+    main(["HANYANG"] + sys.argv[1:])
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ==========================================
+# 🌐 브라우저 없이 그리드 데이터를 직접 받아오는 HTTP 엔진
+# ==========================================
+# 포털의 그리드는 브라우저가 보내는 XHR 응답으로 그려집니다.
+# 브라우저는 로그인/세션 쿠키를 얻을 때 딱 한 번만 쓰고, 이후에는 같은 요청을
+# 커넥션 풀이 붙은 requests.Session 으로 재현합니다.
+#
+# 엔드포인트 URL 과 폼 파라미터는 개발자도구(Network 탭)에서 조회 버튼을 눌렀을 때
+# 나가는 요청을 그대로 복사해 JSON 파일로 저장해 두고 --endpoint 로 넘겨주세요.
+# (예: fixtures/korea/endpoint.json)
+
+# 세션 쿠키를 브라우저에서 옮겨 담은 Session (연결 재사용 → 요청마다 TCP/TLS 핸드셰이크 없음)
+def session_from_driver(driver, pool_size=8):
+    session = make_session(pool_size)
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    session.headers["Referer"] = driver.current_url
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    return session
+
+def make_session(pool_size=8):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["X-Requested-With"] = "XMLHttpRequest"
+    return session
+
+# 녹화 파일 이름이자 스텁 서버의 조회 키: (메서드, 경로, 정렬된 파라미터) 의 해시
+# 호스트는 키에 넣지 않으므로 실제 포털 ↔ 로컬 스텁 서버를 --base-url 로 바꿔 끼울 수 있음
+def request_key(method, path, params):
+    canonical = json.dumps([method.upper(), path, sorted((str(k), str(v)) for k, v in params.items())], ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+# url 의 scheme/host 만 base_url 것으로 교체 (로컬 스텁 서버로 돌릴 때)
+def rebase(url, base_url):
+    if not base_url:
+        return url
+    parts, base = urlsplit(url), urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+def fetch(session, method, url, params, record_dir=None, timeout=20):
+    if method.upper() == "GET":
+        resp = session.get(url, params=params, timeout=timeout)
+    else:
+        resp = session.post(url, data=params, timeout=timeout)
+    resp.raise_for_status()
+    resp.encoding = resp.encoding or "utf-8"
+    text = resp.text
+
+    # 녹화 모드: 응답 원문을 키 이름으로 저장 → stub_server.py 로 오프라인 재생
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+        key = request_key(method, urlsplit(url).path, params)
+        with open(os.path.join(record_dir, key + ".body"), "w", encoding="utf-8") as f:
+            f.write(text)
+    return text
+
+# 개발자도구에서 복사해 둔 요청 정보 {"url": ..., "method": "POST", "params": {...}}
+def load_endpoint(path):
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    spec.setdefault("method", "POST")
+    spec.setdefault("params", {})
+    return spec
+
+# JSON 응답 어딘가에 들어있는 '행 목록' 찾기: marker 키를 가진 dict 들의 리스트
+# (응답 껍데기 구조가 바뀌어도 행 자체의 키(td id 와 동일)만 같으면 그대로 동작)
+def find_rows(payload, marker):
+    if isinstance(payload, list):
+        if payload and all(isinstance(item, dict) for item in payload) and any(marker in item for item in payload):
+            return payload
+        for item in payload:
+            rows = find_rows(item, marker)
+            if rows is not None:
+                return rows
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            rows = find_rows(value, marker)
+            if rows is not None:
+                return rows
+    return None
@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# ==========================================
+# 📈 크롤링 계측: 단계별 시간, 조회/페이지별 시간, 카운터, 에러
+# ==========================================
+# 크롤러 어디서든 METRICS 하나에 기록합니다.
+#   with METRICS.stage("parse"): ...            # 단계별 누적 시간 (page_load, wait, extract, parse, dump ...)
+#   with METRICS.query("전공/공과대학/전체") as q:  # 조회(고려대 조합) / 페이지(한양대) 단위 시간
+#       q["rows"] = 12
+#   METRICS.count("retry")                      # 재시도 같은 단순 카운터
+#   METRICS.error("parse_row", e)               # 예전엔 except: continue 로 묻히던 에러
+# 끝나면 METRICS.write_report(...) 로 JSON 리포트 + 요약 표 출력
+#
+# 프로세스 풀 워커는 자기 METRICS 를 drain() 해서 결과와 같이 돌려주고, 메인에서 merge() 합니다.
+
+ERROR_SAMPLES = 20
+SLOWEST = 15
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    # 배치에서 작업마다 새로 시작 (경과 시간/초당 행 수도 이 시점부터)
+    def reset(self):
+        self.started = time.perf_counter()
+        self.stages = {}    # 이름 → {"count", "total", "max"}
+        self.counters = {}
+        self.errors = {}    # "단계:예외타입" → 횟수
+        self.error_samples = []
+        self.queries = []   # {"key", "seconds", "rows"}
+
+    def _add_stage(self, name, seconds, count=1, longest=None):
+        stat = self.stages.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        stat["count"] += count
+        stat["total"] += seconds
+        stat["max"] = max(stat["max"], seconds if longest is None else longest)
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self._add_stage(name, elapsed)
+
+    @contextmanager
+    def query(self, key):
+        info = {"key": key, "rows": 0}
+        started = time.perf_counter()
+        try:
+            yield info
+        finally:
+            info["seconds"] = time.perf_counter() - started
+            with self.lock:
+                self.queries.append(info)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def error(self, stage, exc):
+        key = f"{stage}:{type(exc).__name__}"
+        with self.lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+            if len(self.error_samples) < ERROR_SAMPLES:
+                self.error_samples.append({"stage": stage, "type": type(exc).__name__, "message": str(exc)[:300]})
+
+    # 워커 → 메인 전달용: 지금까지 기록을 넘기고 비움
+    def drain(self):
+        with self.lock:
+            data = {"stages": self.stages, "counters": self.counters, "errors": self.errors,
+                    "error_samples": self.error_samples, "queries": self.queries}
+            self.reset()
+        return data
+
+    def merge(self, data):
+        with self.lock:
+            for name, stat in data["stages"].items():
+                self._add_stage(name, stat["total"], stat["count"], stat["max"])
+            for name, n in data["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + n
+            for key, n in data["errors"].items():
+                self.errors[key] = self.errors.get(key, 0) + n
+            self.error_samples.extend(data["error_samples"][:max(0, ERROR_SAMPLES - len(self.error_samples))])
+            self.queries.extend(data["queries"])
+
+    def report(self):
+        wall = time.perf_counter() - self.started
+        rows = sum(q["rows"] for q in self.queries)
+        stages = {name: {**stat, "mean": stat["total"] / stat["count"] if stat["count"] else 0.0}
+                  for name, stat in sorted(self.stages.items(), key=lambda item: -item[1]["total"])}
+        slowest = sorted(self.queries, key=lambda q: -q["seconds"])[:SLOWEST]
+        return {
+            "wall_seconds": wall,
+            "queries": len(self.queries),
+            "rows": rows,
+            "rows_per_second": rows / wall if wall else 0.0,
+            "stages": stages,
+            "counters": self.counters,
+            "errors": self.errors,
+            "error_samples": self.error_samples,
+            "slowest_queries": slowest,
+        }
+
+    def write_report(self, path):
+        report = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print_summary(report)
+        print(f"📈 계측 리포트 저장: {path}")
+        return report
+
+def print_summary(report):
+    print(f"\n📈 총 {report['wall_seconds']:.1f}초 / 조회 {report['queries']}건 / {report['rows']}행 ({report['rows_per_second']:.1f} 행/초)")
+    print(f"   {'단계':<14}{'횟수':>8}{'합계(s)':>10}{'평균(ms)':>10}{'최대(ms)':>10}")
+    for name, stat in report["stages"].items():
+        print(f"   {name:<14}{stat['count']:>8}{stat['total']:>10.2f}{stat['mean'] * 1000:>10.1f}{stat['max'] * 1000:>10.1f}")
+    if report["counters"]:
+        print("   카운터: " + ", ".join(f"{k}={v}" for k, v in report["counters"].items()))
+    if report["errors"]:
+        print("   에러  : " + ", ".join(f"{k}={v}" for k, v in report["errors"].items()))
+    for q in report["slowest_queries"][:5]:
+        print(f"   🐢 {q['seconds']:.2f}s  {q['rows']:>4}행  {q['key']}")
+
+def report_path(output_file):
+    base = output_file[:-len(".json")] if output_file.endswith(".json") else output_file
+    return base + ".report.json"
+
+METRICS = Recorder()
@@ -1,220 +1,303 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
+from selenium.common.exceptions import TimeoutException
 import json
-import traceback
+from waits import install_probe, snapshot_grid, wait_for_grid, wait_for_network_idle
+from browser import attach_debug_chrome, launch_headless
+from engine import DEFAULT_SEMESTER, DEFAULT_YEAR, UniversityCrawler, register
+from grid_parser import get_backend
+from timeslots import parse_slots
+from bitmask import slots_mask, to_hex
+from instrument import METRICS
+
+OUTPUT_FILE = 'real_lectures_korea_2026_1.json'
+# 포털 학기(pTerm) 옵션 값 추정: 1학기 / 2학기 (그 밖의 학기는 숫자 그대로)
+# 실제 화면에서 확인한 값이 아니라서 select_term 은 이 값이 없으면 옵션 글자("2학기")로 다시 찾고,
+# 그래도 없으면 경고만 남기고 화면 기본 학기로 진행합니다. HTTP 모드의 학기 파라미터도 같은 값.
+TERM_CODES = {1: "1R", 2: "2R"}
 
 # ==========================================
-# ⚙️ 설정 (디버깅 크롬 연결)
+# ⚙️ 설정 (프레임 / 드롭다운)
 # ==========================================
-def setup_driver():
-    chrome_options = Options()
-    # 🚨 실행 전 CMD에서 크롬 디버깅 모드 실행 필수:
-    # chrome.exe --remote-debugging-port=9222 --user-data-dir="C:\selenium\ChromeProfile"
-    chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
-    driver = webdriver.Chrome(options=chrome_options)
-    return driver
+def enter_frames(driver):
+    try:
+        driver.switch_to.default_content()
+        WebDriverWait(driver, 2).until(EC.frame_to_be_available_and_switch_to_it("Main"))
+        WebDriverWait(driver, 2).until(EC.frame_to_be_available_and_switch_to_it("coreMain"))
+        print("🚪 프레임 진입 완료")
+    except TimeoutException:
+        # 프레임 없이 수강편람만 띄운 화면이면 최상위 문서에서 그대로 진행
+        METRICS.count("no_frames")
+        print("🚪 프레임 없음 - 현재 문서에서 진행")
+
+def valid_options(driver, elem_id):
+    # '선택' 제외하고 실제 값만 (value, text) 로 추출
+    select = Select(driver.find_element(By.ID, elem_id))
+    return [(o.get_attribute("value"), o.text.strip()) for o in select.options if o.get_attribute("value")]
+
+# 드롭다운 선택 후 하위 목록/화면 갱신(XHR)이 끝나는 즉시 다음 단계로
+def select_and_settle(driver, elem_id, value):
+    install_probe(driver)
+    Select(driver.find_element(By.ID, elem_id)).select_by_value(value)
+    wait_for_network_idle(driver)
+
+# 연도/학기 드롭다운 (--year/--semester 를 줬을 때만 엔진이 호출)
+# id(pYear/pTerm)는 같은 화면의 pCourDiv/pCol/pDept 이름 규칙을 따른 추정 → 드롭다운이나 옵션이 없으면 화면 기본값으로 진행
+def select_term(driver, year, semester):
+    wanted = {'pYear': ({str(year)}, str(year)),
+              'pTerm': ({TERM_CODES.get(semester, str(semester)), str(semester)}, f"{semester}학기")}
+    for elem_id, (values, label) in wanted.items():
+        elems = driver.find_elements(By.ID, elem_id)
+        options = Select(elems[0]).options if elems else []
+        option = next((o for o in options if o.get_attribute("value") in values), None) \
+            or next((o for o in options if o.text.strip().startswith(label)), None)
+        if option is None:
+            METRICS.count("term_select_missing")
+            print(f"   ⚠️ {elem_id} 에서 '{label}' 을(를) 찾지 못해 화면 기본값으로 진행")
+            continue
+        select_and_settle(driver, elem_id, option.get_attribute("value"))
+
+def has_choices(driver, elem_id):
+    # 화면에 칸이 보여도, 안에 옵션이 '선택' 하나뿐이면 사실상 없는 것 취급해야 함
+    elem = driver.find_element(By.ID, elem_id)
+    return elem.is_displayed() and len(Select(elem).options) > 1
 
 # ==========================================
-# 🕷️ 메인 로직
+# 🗺️ [1단계] 조회 조합 미리 뽑기
 # ==========================================
-def main():
-    driver = None
-    all_lectures = []
-    unique_ids = set() # 중복 방지
+# 이수구분 × (교양영역 | 단과대 × 학과) 의 '잎' 조합을 순서대로 나열합니다.
+# 조합 하나 = 조회 버튼 한 번. 병렬 모드에서는 이 목록을 워커들이 나눠 가집니다.
+def enumerate_combos(driver):
+    combos = []
+    cour_options = valid_options(driver, 'pCourDiv')
+    print(f"🔎 총 {len(cour_options)}개의 이수구분을 탐색합니다.")
 
-    try:
-        driver = setup_driver()
-        print("✅ 디버깅 크롬 브라우저 연결 성공!")
+    for cour_val, cour_text in cour_options:
+        select_and_settle(driver, 'pCourDiv', cour_val) # ⚠️ 중요: 화면 갱신될 때까지 대기
+        print(f"\n📂 [1단계] {cour_text} ({cour_val}) 진입...")
 
-        # 1. 프레임 진입
-        try:
-            driver.switch_to.default_content()
-            WebDriverWait(driver, 2).until(EC.frame_to_be_available_and_switch_to_it("Main"))
-            WebDriverWait(driver, 2).until(EC.frame_to_be_available_and_switch_to_it("coreMain"))
-            print("🚪 프레임 진입 완료")
-        except:
-            pass
-
-        # 2. [1단계] 이수구분 목록 가져오기
-        cour_select = Select(driver.find_element(By.ID, 'pCourDiv'))
-        # '선택' 제외하고 실제 값만 추출
-        cour_options = [opt for opt in cour_select.options if opt.get_attribute("value")]
-        
-        print(f"🔎 총 {len(cour_options)}개의 이수구분을 탐색합니다.")
-
-        # -------------------------------------------------------
-        # 🔁 메인 루프: 이수구분 하나씩 도장깨기
-        # -------------------------------------------------------
-        for opt in cour_options:
-            cour_val = opt.get_attribute("value")
-            cour_text = opt.text.strip()
-            
-            # (1) 이수구분 변경
-            Select(driver.find_element(By.ID, 'pCourDiv')).select_by_value(cour_val)
-            time.sleep(1.5) # ⚠️ 중요: 화면 갱신될 때까지 충분히 대기
+        base = {"pCourDiv": cour_val, "category": cour_text}
 
-            print(f"\n📂 [1단계] {cour_text} ({cour_val}) 진입...")
+        # --- CASE A: 교양 영역(pGroupCd)이 유효한가? ---
+        if has_choices(driver, 'pGroupCd'):
+            for g_val, g_text in valid_options(driver, 'pGroupCd'):
+                combos.append({**base, "pGroupCd": g_val, "college": "교양", "department": g_text})
 
-            # (2) 화면 상태 동적 감지
-            # 화면에 단과대/영역 칸이 보여도, 안에 옵션이 '선택' 하나뿐이면 사실상 없는 것 취급해야 함
-            group_elem = driver.find_element(By.ID, 'pGroupCd')
-            col_elem = driver.find_element(By.ID, 'pCol')
-            
-            # --- CASE A: 교양 영역(pGroupCd)이 유효한가? ---
-            if group_elem.is_displayed() and len(Select(group_elem).options) > 1:
-                group_select = Select(group_elem)
-                # '선택' 제외 유효 옵션만
-                group_opts = [o for o in group_select.options if o.get_attribute("value")]
-                
-                for g_opt in group_opts:
-                    g_val = g_opt.get_attribute("value")
-                    g_text = g_opt.text.strip()
-                    
-                    Select(driver.find_element(By.ID, 'pGroupCd')).select_by_value(g_val)
-                    time.sleep(0.5)
-                    
-                    print(f"   📘 [영역] {g_text} 조회")
-                    click_search_and_parse(driver, cour_text, "교양", g_text, all_lectures, unique_ids)
-
-            # --- CASE B: 단과대(pCol)가 유효한가? ---
-            elif col_elem.is_displayed() and len(Select(col_elem).options) > 1:
-                col_select = Select(col_elem)
-                col_opts = [o for o in col_select.options if o.get_attribute("value")]
-
-                for c_opt in col_opts:
-                    c_val = c_opt.get_attribute("value")
-                    c_text = c_opt.text.strip()
-
-                    Select(driver.find_element(By.ID, 'pCol')).select_by_value(c_val)
-                    time.sleep(0.5)
-                    print(f"   🏫 [단과대] {c_text}")
-
-                    # (3) 학과(pDept) 체크
-                    dept_elem = driver.find_element(By.ID, 'pDept')
-                    if dept_elem.is_displayed() and len(Select(dept_elem).options) > 1:
-                        dept_select = Select(dept_elem)
-                        dept_opts = [d for d in dept_select.options if d.get_attribute("value")]
-                        
-                        for d_opt in dept_opts:
-                            d_val = d_opt.get_attribute("value")
-                            d_text = d_opt.text.strip()
-                            
-                            Select(driver.find_element(By.ID, 'pDept')).select_by_value(d_val)
-                            time.sleep(0.3)
-                            click_search_and_parse(driver, cour_text, c_text, d_text, all_lectures, unique_ids)
-                    else:
-                        # 학과가 없으면 단과대 전체 조회
-                        print(f"      ㄴ 학과 세부 없음 -> 바로 조회")
-                        click_search_and_parse(driver, cour_text, c_text, "전체", all_lectures, unique_ids)
-
-            # --- CASE C: 하위 분류가 아무것도 없음 (군사학, 평생교육사 등) ---
-            else:
-                print(f"   ⚡ 하위 분류 없음 -> 즉시 '조회' 버튼 클릭!")
-                click_search_and_parse(driver, cour_text, "기타", "전체", all_lectures, unique_ids)
-
-        # 최종 저장
-        save_to_json(all_lectures)
-
-    except Exception:
-        traceback.print_exc()
+        # --- CASE B: 단과대(pCol)가 유효한가? ---
+        elif has_choices(driver, 'pCol'):
+            for c_val, c_text in valid_options(driver, 'pCol'):
+                select_and_settle(driver, 'pCol', c_val)
+
+                # (3) 학과(pDept) 체크
+                if has_choices(driver, 'pDept'):
+                    for d_val, d_text in valid_options(driver, 'pDept'):
+                        combos.append({**base, "pCol": c_val, "pDept": d_val, "college": c_text, "department": d_text})
+                else:
+                    # 학과가 없으면 단과대 전체 조회
+                    combos.append({**base, "pCol": c_val, "college": c_text, "department": "전체"})
+
+        # --- CASE C: 하위 분류가 아무것도 없음 (군사학, 평생교육사 등) ---
+        else:
+            combos.append({**base, "college": "기타", "department": "전체"})
+
+    print(f"\n🧮 조회 조합 {len(combos)}개 준비 완료")
+    return combos
 
+# 조합에 맞게 드롭다운을 차례로 선택 (상위 → 하위 순서를 지켜야 하위 목록이 갱신됨)
+def apply_combo(driver, combo):
+    select_and_settle(driver, 'pCourDiv', combo["pCourDiv"])
+    for elem_id in ('pGroupCd', 'pCol', 'pDept'):
+        if elem_id in combo:
+            select_and_settle(driver, elem_id, combo[elem_id])
+
+def combo_key(combo):
+    return f"{combo['category']}/{combo['college']}/{combo['department']}"
+
+# ==========================================
+# 🌐 HTTP 모드: 조회 버튼 대신 그리드 XHR 을 조합 파라미터로 직접 요청
+# ==========================================
+def combo_params(combo):
+    return {key: combo[key] for key in ('pCourDiv', 'pGroupCd', 'pCol', 'pDept') if key in combo}
 
 # ==========================================
 # 🔍 공통: 조회 버튼 클릭 및 데이터 파싱
 # ==========================================
-def click_search_and_parse(driver, category, college, dept, results, unique_ids):
-    try:
-        # 조회 버튼 클릭 (JavaScript 실행이 더 안정적)
+GRID_TBODY = "#gridLecture > tbody"
+
+# 조회 버튼 클릭 → 그리드가 바뀌면 HTML 통째로
+def search_grid(driver):
+    # 조회 버튼 클릭 (JavaScript 실행이 더 안정적)
+    with METRICS.stage("click"):
+        before = snapshot_grid(driver, GRID_TBODY)
         search_btn = driver.find_element(By.ID, 'btnSearch')
         driver.execute_script("arguments[0].click();", search_btn)
-        
-        # 데이터 로딩 대기
-        time.sleep(1.5)
 
-        # BS4 파싱
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        rows = soup.select('#gridLecture > tbody > tr')
+    # 데이터 로딩 대기 (그리드가 바뀌는 즉시 진행)
+    with METRICS.stage("wait"):
+        if not wait_for_grid(driver, GRID_TBODY, before):
+            METRICS.count("grid_unchanged")
+
+    with METRICS.stage("page_source"):
+        return driver.page_source
+
+# 브라우저 page_source 든 HTTP 응답 본문이든 같은 함수로 파싱 → 두 모드의 결과가 항상 같음
+# backend: grid_parser 백엔드 (None 이면 설치된 것 중 가장 빠른 것)
+def parse_grid_html(html, category, college, dept, results, unique_ids, backend=None, year=DEFAULT_YEAR, semester=DEFAULT_SEMESTER):
+    parser = backend or get_backend()
+    # #gridLecture > tbody > tr 만 잘라서 파싱
+    # (XHR 응답이 표 전체가 아니라 행 조각(<tr>...)만 오는 경우는 모든 tr)
+    rows = parser.rows(html)
+
+    if not rows: return
+    # '데이터가 없습니다' 처리
+    text = parser.text(rows[0]) if len(rows) == 1 else ""
+    if "없습니다" in text or "No data" in text:
+        return
+
+    def get_text(cell, separator=""):
+        return separator.join(parser.strings(cell))
+
+    count = 0
+    for row in rows:
+        try:
+            cols = parser.cells(row)
+            if len(cols) < 8: continue
+
+            course_id = get_text(cols[1])
+            section = get_text(cols[2])
+            full_id = f"{course_id}-{section}" # ID 생성
 
-        if not rows: return
-        # '데이터가 없습니다' 처리
-        if len(rows) == 1 and ("없습니다" in rows[0].text or "No data" in rows[0].text):
-            return
+            if full_id in unique_ids: continue # 중복 제거
+            unique_ids.add(full_id)
 
-        count = 0
-        for row in rows:
+            # 강의명 및 상세정보
+            name_cell = cols[5]
+            name = get_text(name_cell)
+            
+            details = []
+            # 1. MOOC 태그 확인
+            if parser.has_mooc(name_cell):
+                details.append("MOOC")
+                if name.endswith('M'): name = name[:-1].strip()
+            
+            # 2. 강의명에 포함된 단어 확인
+            if "영강" in name: details.append("영강")
+            if "외국어" in name: details.append("외국어강의")
+            
+            # 👇 [추가된 부분] 강의명에 '유연학기'가 있으면 태그 추가!
+            if "유연학기" in name: details.append("유연학기")
+
+            prof = get_text(cols[6])
+            
+            # 학점 처리 '3(3)' -> 3.0
             try:
-                cols = row.find_all('td')
-                if len(cols) < 8: continue
-
-                course_id = cols[1].get_text(strip=True)
-                section = cols[2].get_text(strip=True)
-                full_id = f"{course_id}-{section}" # ID 생성
-
-                if full_id in unique_ids: continue # 중복 제거
-                unique_ids.add(full_id)
-
-                # 강의명 및 상세정보
-                name_cell = cols[5]
-                name = name_cell.get_text(strip=True)
-                
-                details = []
-                # 1. MOOC 태그 확인
-                if name_cell.find('span', class_='label-type', string='M'):
-                    details.append("MOOC")
-                    if name.endswith('M'): name = name[:-1].strip()
-                
-                # 2. 강의명에 포함된 단어 확인
-                if "영강" in name: details.append("영강")
-                if "외국어" in name: details.append("외국어강의")
-                
-                # 👇 [추가된 부분] 강의명에 '유연학기'가 있으면 태그 추가!
-                if "유연학기" in name: details.append("유연학기")
-
-                prof = cols[6].get_text(strip=True)
-                
-                # 학점 처리 '3(3)' -> 3.0
-                try:
-                    credit = float(cols[7].get_text(strip=True).split('(')[0])
-                except:
-                    credit = 0.0
-
-                time_room = cols[8].get_text(separator=" ", strip=True)
-
-                lecture = {
-                    "id": full_id,
-                    "name": name,
-                    "professor": prof,
-                    "credit": credit,
-                    "timeRoom": time_room,
-                    "category": category,
-                    "college": college,
-                    "department": dept,
-                    "details": ",".join(details), # 여기에 '유연학기'가 포함되어 저장됩니다.
-                    "year": 2025,
-                    "semester": 1
-                }
-                results.append(lecture)
-                count += 1
-            except:
-                continue
-        
-        if count > 0:
-            print(f"      ✅ {count}건 수집 완료 ({dept})")
-
-    except Exception as e:
-        print(f"      ❌ 조회 중 에러: {e}")
-
-def save_to_json(data):
-    filename = 'real_lectures_korea_2026_1.json'
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-    print(f"\n🎉 크롤링 종료! 총 {len(data)}개 강의 저장됨.")
+                credit = float(get_text(cols[7]).split('(')[0])
+            except ValueError:
+                METRICS.count("credit_fallback")
+                credit = 0.0
+
+            time_room = get_text(cols[8], " ")
+
+            slots = parse_slots(time_room, "KOREA", name)
+
+            lecture = {
+                "id": full_id,
+                "name": name,
+                "professor": prof,
+                "credit": credit,
+                "timeRoom": time_room,
+                "category": category,
+                "college": college,
+                "department": dept,
+                "details": ",".join(details), # 여기에 '유연학기'가 포함되어 저장됩니다.
+                "year": year,
+                "semester": semester,
+                "slots": slots, # 분 단위 (day, start, end, room)
+                "weekMask": to_hex(slots_mask(slots)) # 5분 단위 주간 비트마스크 (충돌 검사용)
+            }
+            results.append(lecture)
+            count += 1
+        except Exception as e:
+            METRICS.error("parse_row", e)
+            continue
+    
+    if count > 0:
+        print(f"      ✅ {count}건 수집 완료 ({dept})")
+
+def load_combos(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# ==========================================
+# 🕷️ 고려대 크롤러 (병렬/HTTP/이어하기/출력은 engine.py)
+# ==========================================
+# 조회 단위 = 드롭다운 조합 하나 (이수구분 × 교양영역 | 단과대 × 학과)
+@register
+class KoreaCrawler(UniversityCrawler):
+    name = "KOREA"
+    title = "고려대"
+    output_file = OUTPUT_FILE
+    checkpoint_every = 20
+    # 로그인한 디버깅 크롬의 쿠키를 헤드리스로 옮겨서 그리드 조회가 되는지는 확인 못 함
+    # → 브라우저 모드는 디버깅 크롬 하나로 순차만 (병렬은 --http, 직접 확인했으면 --clone-session)
+    clone_session = False
+
+    def __init__(self, args):
+        super().__init__(args)
+        self.backend = get_backend(getattr(args, "parser", None))
+
+    def term_values(self):
+        return {"year": str(self.year), "semester": TERM_CODES.get(self.semester, str(self.semester))}
+
+    def select_term(self, driver):
+        select_term(driver, self.year, self.semester)
+
+    def preset_queries(self):
+        return load_combos(self.args.queries) if self.args.queries else None
+
+    def enumerate_queries(self, driver):
+        return enumerate_combos(driver)
+
+    def query_key(self, combo):
+        return combo_key(combo)
+
+    def cache_params(self, combo):
+        return combo_params(combo)
+
+    # 디버깅 크롬에 붙어서 프레임 진입 (사람이 열어둔 창이라 끝나도 닫지 않음)
+    def open_browser(self):
+        driver = attach_debug_chrome()
+        print("✅ 디버깅 크롬 브라우저 연결 성공!")
+        enter_frames(driver)
+        return driver
+
+    # --clone-session 일 때만 씀
+    def new_browser(self, url, cookies):
+        driver = launch_headless(url, cookies)
+        enter_frames(driver)
+        return driver
+
+    def close_browser(self, driver):
+        pass
+
+    def fetch(self, driver, combo):
+        with METRICS.stage("select"):
+            apply_combo(driver, combo)
+        print(f"   🔍 [{combo['category']}] {combo['college']} / {combo['department']}")
+        return search_grid(driver)
+
+    def request_params(self, combo, endpoint):
+        return combo_params(combo)
+
+    def parse(self, combo, html):
+        results = []
+        parse_grid_html(html, combo["category"], combo["college"], combo["department"], results, set(), self.backend,
+                        self.year, self.semester)
+        return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import sys
+    from crawl import main
+    main(["KOREA"] + sys.argv[1:])
@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from instrument import METRICS
+
+# ==========================================
+# 🚦 포털 요청 속도 조절 (AIMD) + 재시도
+# ==========================================
+# 동시에 나가는 요청 수(limit)와 요청 시작 간격(interval)을 응답 상태를 보면서 스스로 맞춥니다.
+#   - 정상 응답: limit 을 조금씩 올리고 (+1/limit → 한 바퀴에 +1), interval 은 줄임
+#   - 평균 지연이 평소(가장 빨랐던 지연)의 tolerance 배를 넘음: limit 을 절반으로
+#   - 타임아웃/429/5xx/연결 끊김: limit 절반 + interval 두 배
+#   (한 번 줄인 뒤 평균 지연 시간 동안은 또 줄이지 않음)
+# → 포털이 버틸 만큼은 최대한 빨리, 느려지기 시작하면 바로 물러남
+#
+#   limiter = AdaptiveLimiter(max_concurrency=8)
+#   with limiter.slot(): fetch(...)
+#   retry(lambda: ..., attempts=4)   # 일시적인 에러만 지터 백오프로 재시도
+
+class AdaptiveLimiter:
+    def __init__(self, max_concurrency=1, min_concurrency=1, min_interval=0.0, max_interval=5.0,
+                 tolerance=2.0, decrease=0.5):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.tolerance = tolerance
+        self.decrease = decrease
+
+        self.limit = float(self.min_concurrency) # 천천히 시작해서 올려감
+        self.interval = min_interval
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.floor = None   # 지금까지 가장 빨랐던 지연 (기준)
+        self.average = None # 지연 지수 이동 평균
+        self.last_cut = 0.0
+        self.cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        with self.cond:
+            while self.in_flight >= int(self.limit):
+                self.cond.wait()
+            self.in_flight += 1
+            now = time.monotonic()
+            start_at = max(now, self.next_start)
+            self.next_start = start_at + self.interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._observe(time.monotonic() - started, is_congestion(e))
+            raise
+        else:
+            self._observe(time.monotonic() - started, False)
+        finally:
+            with self.cond:
+                self.in_flight -= 1
+                self.cond.notify_all()
+
+    def _observe(self, latency, congested):
+        with self.cond:
+            self.average = latency if self.average is None else self.average * 0.8 + latency * 0.2
+            # 기준 지연은 가장 빠른 값을 따라가되, 서버가 전반적으로 느려진 경우를 위해 아주 조금씩 평균 쪽으로
+            self.floor = latency if self.floor is None else min(latency, self.floor + (self.average - self.floor) * 0.01)
+
+            now = time.monotonic()
+            slow = self.average > self.floor * self.tolerance
+            if congested or slow:
+                if now - self.last_cut > self.average:
+                    self.limit = max(self.min_concurrency, self.limit * self.decrease)
+                    # 간격은 명시적인 거절(429/타임아웃 등)일 때만 벌림 - 단순히 느린 건 동시 요청 수로 충분
+                    if congested:
+                        self.interval = min(self.max_interval, max(self.interval * 2, self.min_interval, 0.05))
+                    self.last_cut = now
+                    METRICS.count("limiter_backoff")
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            if not congested:
+                self.interval = max(self.min_interval, self.interval * 0.8 if self.interval > 0.01 else 0.0)
+            self.cond.notify_all()
+
+    def state(self):
+        return {"limit": int(self.limit), "interval": round(self.interval, 3), "latency": self.average}
+
+# 서버가 힘들다는 신호 (→ 속도 줄임)
+def is_congestion(exc):
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, (requests.Timeout, requests.ConnectionError, TimeoutException, TimeoutError))
+
+# 다시 해보면 될 수도 있는 에러 (→ 재시도). 파싱 에러처럼 매번 똑같이 날 에러는 제외
+def is_retryable(exc):
+    return is_congestion(exc) or isinstance(exc, (WebDriverException, ConnectionError))
+
+# 지수 백오프 + full jitter (0 ~ min(cap, base·2ⁿ) 사이 무작위 대기) → 워커들이 한꺼번에 다시 몰려가지 않음
+def retry(fn, attempts=4, base=0.5, cap=10.0, label="fetch"):
+    for attempt in range(1, attempts + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= attempts or not is_retryable(e):
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+            METRICS.count("retry")
+            METRICS.error(f"{label}_retry", e)
+            print(f"      🔁 {label} 재시도 {attempt}/{attempts - 1} ({type(e).__name__}) - {delay:.1f}초 후")
+            time.sleep(delay)
@@ -0,0 +1,145 @@
+import argparse
+import gzip
+import json
+import os
+
+# ==========================================
+# 📝 스트리밍 NDJSON 출력 (한 줄 = 강의 하나)
+# ==========================================
+# 수집하는 즉시 한 줄씩 쓰고 batch_size 개마다 디스크로 flush 하므로
+# 학기/학교를 몇 개를 돌리든 메모리에 강의 목록을 통째로 들고 있지 않습니다.
+# 서버(LectureDataLoader)가 읽는 JSON 배열 파일은 마지막에 ndjson_to_json 으로 변환합니다.
+
+def ndjson_path(output_file, use_gzip=False):
+    base = output_file[:-len(".json")] if output_file.endswith(".json") else output_file
+    return base + (".ndjson.gz" if use_gzip else ".ndjson")
+
+# 파일 이름으로 학교 추측 (timeRoom 해석 규칙이 학교마다 다름)
+def guess_university(path):
+    lowered = os.path.basename(path).lower()
+    for university in ("korea", "hanyang"):
+        if university in lowered:
+            return university.upper()
+    return None
+
+# 서버(LectureDataLoader)와 같은 분반 id: 한양대 학수번호는 분반마다 반복되므로 파일 순서대로 "-01", "-02" ...
+# (고려대 id 는 원래 "COSE101-02" 처럼 분반까지 들어 있어 그대로)
+def with_section_ids(lectures, university):
+    counts = {}
+    for lecture in lectures:
+        if university == "HANYANG":
+            count = counts[lecture["id"]] = counts.get(lecture["id"], 0) + 1
+            lecture = {**lecture, "id": f"{lecture['id']}-{count:02d}"}
+        yield lecture
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+class LectureWriter:
+    # compact=True 면 구분자 공백까지 빼서 더 작게 씀 (읽을 때는 차이 없음)
+    def __init__(self, path, batch_size=200, compact=False, keep=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.separators = (",", ":") if compact else None
+        self.buffer = []
+        self.count = 0
+
+        # 이어하기: 체크포인트 시점까지의 줄만 남기고 그 뒤에 이어 씀
+        if keep is not None and os.path.exists(path):
+            truncate_ndjson(path, keep)
+            self.count = keep
+            self.file = _open(path, "a")
+        else:
+            self.file = _open(path, "w")
+
+    def write(self, lecture):
+        self.buffer.append(json.dumps(lecture, ensure_ascii=False, separators=self.separators))
+        self.count += 1
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.buffer = []
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_ndjson(path):
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+# 결과 파일 종류와 상관없이 강의를 하나씩 (JSON 배열 / NDJSON / NDJSON.gz)
+def read_lectures(path):
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+    else:
+        yield from read_ndjson(path)
+
+# 앞의 keep 줄만 남기기 (gzip 은 제자리 자르기가 안 되므로 새로 써서 바꿔치기)
+# 강제 종료된 .gz 는 끝 표시(trailer)가 없어서 끝까지 읽으면 EOFError → 그 전까지 풀린 줄만 씀
+# (flush 때마다 sync flush 로 내려가므로 체크포인트 시점까지의 줄은 온전히 풀림)
+def truncate_ndjson(path, keep):
+    if path.endswith(".gz"):
+        tmp_path = path[:-len(".gz")] + ".tmp.gz"
+        kept = 0
+        with gzip.open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+            try:
+                for line in src:
+                    if kept >= keep or not line.endswith(b"\n"): break
+                    dst.write(line)
+                    kept += 1
+            except EOFError:
+                pass
+        if kept < keep:
+            os.remove(tmp_path)
+            raise RuntimeError(f"{path}: 체크포인트는 {keep}줄인데 {kept}줄만 읽힘. --resume 없이 다시 수집하세요.")
+        os.replace(tmp_path, path)
+        return
+    with open(path, "r+b") as f:
+        for _ in range(keep):
+            if not f.readline(): break
+        f.truncate()
+
+# NDJSON/SQLite/Parquet 에만 두고 서버용 JSON 배열에는 넣지 않는 필드 (timeRoom 에서 다시 만들 수 있는 파생값)
+# weekMask 가 강의마다 최대 수백 글자라 서버가 읽는 파일이 두 배 넘게 커짐
+DERIVED_FIELDS = ("slots", "weekMask")
+
+# NDJSON → 기존과 똑같은 JSON 배열 파일 (json.dump(..., ensure_ascii=False, indent=4) 와 바이트 단위로 동일)
+# 강의를 하나씩 읽어서 바로 써 내려가므로 역시 메모리는 일정함
+def ndjson_to_json(src, dst):
+    count = 0
+    with open(dst, "w", encoding="utf-8") as out:
+        for lecture in read_ndjson(src):
+            for field in DERIVED_FIELDS:
+                lecture.pop(field, None)
+            body = json.dumps(lecture, ensure_ascii=False, indent=4).replace("\n", "\n    ")
+            out.write(("[\n    " if count == 0 else ",\n    ") + body)
+            count += 1
+        out.write("\n]" if count else "[]")
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="NDJSON → 서버용 JSON 배열 변환")
+    parser.add_argument("src", help="입력 .ndjson 또는 .ndjson.gz")
+    parser.add_argument("dst", help="출력 .json")
+    args = parser.parse_args()
+    count = ndjson_to_json(args.src, args.dst)
+    print(f"📂 변환 완료: {args.dst} (총 {count}개 강의)")
+
+if __name__ == "__main__":
+    main()
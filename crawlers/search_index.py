@@ -0,0 +1,276 @@
+import argparse
+import heapq
+import json
+import os
+import re
+import struct
+import unicodedata
+import zlib
+from functools import lru_cache
+
+from output import guess_university, read_lectures, with_section_ids
+from timeslots import split_schedule
+
+# ==========================================
+# 🔎 강의 검색 인덱스 (강의명 / 교수명 / 학수번호)
+# ==========================================
+# 서버의 getSearchLectures 는 검색할 때마다 전체 강의를 돌며 contains 를 합니다.
+# 크롤링 결과로 미리 역색인을 만들어 두면 후보만 보고 끝남.
+#   - 정규화: "[강의시간] ..." 꼬리 제거, 소문자, 공백 제거  ("자료 구조" == "자료구조")
+#   - 글자 1-gram / 2-gram → 강의 번호 목록 (검색어의 gram 목록을 교집합 → 후보 → 실제 포함 여부 확인)
+#   - 마지막 글자는 자모 단위 접두어로도 맞춤: 입력 중인 "컴퓨ㅌ", "컴퓨터고" → "컴퓨터공학"
+#   - 한 글자/자모 하나("ㄱ", "기")는 수천 행이 걸리므로 limit 만큼만 골라내고, 앞쪽 결과를 검색어별로 기억해 둠
+# 결과는 서버 검색 결과와 같은 id 목록 (한양대는 분반별 "CUL1122-03"), 잘 맞는 순서대로.
+#
+#   python search_index.py build real_lectures_korea_2026_1.json -o korea.idx
+#   python search_index.py query korea.idx 자료구조
+
+MAGIC = b"LIDX1"
+FIELDS = ["name", "professor", "id"]
+SHORT_TOP = 100      # 한 글자 검색은 앞쪽 이만큼을 기억 (검색창 자동완성은 보통 이보다 적게 씀)
+SHORT_CACHE = 4096   # 기억해 둘 한 글자 검색어 수
+
+# ------------------------------------------
+# 한글 자모
+# ------------------------------------------
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+# 겹받침/겹모음은 입력하는 순서대로 풀어야 "닭" 을 치는 도중의 "달ㄱ" 이 아니라 "닭" 의 앞부분으로 맞음
+COMPOUND = {"ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+            "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+            "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"}
+
+@lru_cache(maxsize=None)
+def jamo(char):
+    code = ord(char) - 0xAC00
+    if not 0 <= code < 11172:
+        return COMPOUND.get(char, char)
+    parts = CHOSEONG[code // 588] + JUNGSEONG[code % 588 // 28] + JONGSEONG[code % 28].strip()
+    return "".join(COMPOUND.get(part, part) for part in parts)
+
+# 자모 접두어가 tail 인 글자들 ("ㅌ" → 타, 탁, ... 힣 전까지 / "터" → 터, 턱, 턴, ...)
+@lru_cache(maxsize=4096)
+def completions(tail):
+    first = CHOSEONG.find(tail[0])
+    if first == -1:
+        return frozenset(tail) if len(tail) == 1 else frozenset()
+    block = (chr(code) for code in range(0xAC00 + first * 588, 0xAC00 + (first + 1) * 588))
+    if len(tail) == 1: # 초성만 → 그 초성으로 시작하는 글자 전부
+        return frozenset(block) | {tail}
+    return frozenset(char for char in block if jamo(char).startswith(tail))
+
+def normalize(text):
+    name, _ = split_schedule(text or "")
+    return "".join(unicodedata.normalize("NFC", name).lower().split())
+
+def ngrams(text):
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+# text 안에 query 가 있는지 (마지막 글자는 자모 접두어로) → 찾은 위치, 없으면 -1
+def find(text, query, tail):
+    head = query[:-1]
+    position = text.find(head)
+    while position != -1:
+        end = position + len(head)
+        if end < len(text) and jamo(text[end]).startswith(tail):
+            return position
+        position = text.find(head, position + 1)
+    return -1
+
+# ------------------------------------------
+# 번호 목록 직렬화: 차이값을 varint 로 (정렬된 번호라 대부분 1바이트)
+# ------------------------------------------
+def _encode(numbers):
+    out = bytearray()
+    previous = 0
+    for number in numbers:
+        delta = number - previous
+        previous = number
+        while delta >= 0x80:
+            out.append(delta & 0x7F | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+def _decode(data):
+    numbers, value, shift, previous = [], 0, 0, 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += value
+        numbers.append(previous)
+        value, shift = 0, 0
+    return numbers
+
+# ==========================================
+# 🗂️ 인덱스
+# ==========================================
+# 문서 = 결과 행 하나. id 는 서버(LectureDataLoader)와 같게: 한양대는 분반마다 "-01", "-02" ... 를 붙임
+# (학수번호만 쓰면 분반마다 다른 교수명/강의명이 첫 분반 것에 가려서 검색이 안 됨)
+class SearchIndex:
+    def __init__(self, ids, texts, postings):
+        self.ids = ids          # 문서 번호 → 강의 id
+        self.texts = texts      # 문서 번호 → [정규화 강의명, 교수명, 학수번호]
+        self.postings = postings # gram → 문서 번호 frozenset
+        self.letters = [gram for gram in postings if len(gram) == 1] # 인덱스에 나오는 글자 전부
+        self.leading = {}       # 강의명 첫 글자 → 문서 번호 목록 (한 글자 검색의 '강의명 시작' 후보)
+        for doc, (name, _, _) in enumerate(texts):
+            if name: self.leading.setdefault(name[0], []).append(doc)
+        self._matching = {}     # 마지막 글자 자모 → (맞는 글자들, 그 글자들의 정규식)
+        self._short = {}        # 한 글자 검색어 → 앞쪽 SHORT_TOP 개 id
+
+    @classmethod
+    def build(cls, lectures, university=None):
+        ids, texts = [], []
+        postings = {}
+        for doc, lecture in enumerate(with_section_ids(lectures, university)):
+            ids.append(lecture["id"])
+            fields = [normalize(lecture.get(field, "")) for field in FIELDS]
+            texts.append(fields)
+            for gram in set().union(*(ngrams(field) for field in fields)):
+                postings.setdefault(gram, []).append(doc)
+        return cls(ids, texts, {gram: frozenset(docs) for gram, docs in postings.items()})
+
+    # 인덱스에 있는 글자 중 자모가 tail 로 시작하는 것들 ("ㄱ" → 가, 각, 강, ... / "기" → 기, 긱, 긴, ...)
+    def matching(self, tail):
+        found = self._matching.get(tail)
+        if found is None:
+            chars = sorted(char for char in self.letters if jamo(char).startswith(tail))
+            pattern = re.compile("[" + "".join(map(re.escape, chars)) + "]") if chars else None
+            found = self._matching[tail] = (chars, pattern)
+        return found
+
+    # 앞 글자들의 gram 교집합 ∩ (바로 앞 글자 + 마지막 글자가 될 수 있는 글자들) 의 합집합
+    def candidates(self, query, tail):
+        head = query[:-1]
+        if not head: # 한 글자: 맞는 글자들의 1-gram 합집합
+            return frozenset().union(*(self.postings[char] for char in self.matching(tail)[0]))
+        lists = [self.postings.get(gram, frozenset()) for gram in ngrams(head)]
+        last = [self.postings[head[-1:] + char] for char in completions(tail) if head[-1:] + char in self.postings]
+        lists.append(frozenset().union(*last))
+        lists.sort(key=len)
+        return lists[0].intersection(*lists[1:])
+
+    # 점수가 낮을수록 위: 강의명 완전 일치 → 강의명 시작 → 강의명 포함 → 교수명 → 학수번호
+    # locate(text) = query 를 찾은 위치 (없으면 -1)
+    def _rank(self, doc, query, locate):
+        name, professor, lecture_id = self.texts[doc]
+        position = locate(name)
+        if position != -1:
+            exact = len(name) == len(query) and position == 0 and name[-1] == query[-1]
+            return (0 if exact else 1 if position == 0 else 2, len(name), doc)
+        position = locate(professor)
+        if position != -1:
+            return (3 if position == 0 else 4, len(professor), doc)
+        if locate(lecture_id) != -1:
+            return (5, len(lecture_id), doc)
+        return None
+
+    def search(self, text, limit=None):
+        query = normalize(text)
+        if not query:
+            return []
+        # 마지막 글자는 입력 중일 수 있으므로 자모 단위로 맞춤
+        tail = jamo(query[-1])
+        if len(query) > 1:
+            return self._search(query, tail, lambda field: find(field, query, tail), limit)
+
+        # 한 글자: 글자마다 자모를 비교하는 대신 맞는 글자들의 정규식 한 번으로 위치를 찾음
+        pattern = self.matching(tail)[1]
+        locate = lambda field: (lambda m: m.start() if m else -1)(pattern.search(field))
+        if limit is None or limit > SHORT_TOP:
+            return self._search(query, tail, locate, limit)
+        top = self._short.get(query)
+        if top is None:
+            top = self._leading(query, tail, SHORT_TOP)
+            if top is None:
+                quick = self._leading(query, tail, limit) # 기억할 만큼은 안 돼도 이번 limit 은 채울 수 있으면
+                if quick is not None:
+                    return quick
+                top = self._search(query, tail, locate, SHORT_TOP)
+            if len(self._short) < SHORT_CACHE:
+                self._short[query] = top
+        return top[:limit]
+
+    # 강의명이 맞는 글자로 시작하는 행(순위 0/1)만으로 limit 개가 차면 나머지 후보는 볼 필요 없음. 못 채우면 None
+    def _leading(self, query, tail, limit):
+        docs = [doc for char in self.matching(tail)[0] for doc in self.leading.get(char, ())]
+        if len(docs) < limit:
+            return None
+        ranks = ((0 if self.texts[doc][0] == query else 1, len(self.texts[doc][0]), doc) for doc in docs)
+        top = list(dict.fromkeys(self.ids[doc] for _, _, doc in heapq.nsmallest(limit, ranks)))
+        return top if len(top) == limit else None
+
+    def _search(self, query, tail, locate, limit):
+        ranked = [rank for rank in (self._rank(doc, query, locate) for doc in self.candidates(query, tail)) if rank is not None]
+        # 같은 id 인 행이 여럿이면 (서버의 groupBy 처럼) 가장 잘 맞는 자리에 하나만
+        unique = lambda ranks: list(dict.fromkeys(self.ids[doc] for _, _, doc in ranks))
+        if limit is not None:
+            # 앞쪽 limit 개만 골라서 정렬 (id 중복으로 모자라면 전체 정렬로)
+            top = unique(heapq.nsmallest(limit, ranked))
+            if len(top) == limit or len(ranked) <= limit:
+                return top
+        ranked.sort()
+        return unique(ranked)[:limit]
+
+    # --------------------------------------
+    # 파일: MAGIC + 머리 길이 + zlib(JSON 머리) + 번호 목록 바이트
+    # --------------------------------------
+    def save(self, path):
+        grams = sorted(self.postings)
+        blobs = [_encode(sorted(self.postings[gram])) for gram in grams]
+        header = json.dumps({"ids": self.ids, "texts": self.texts, "grams": grams,
+                             "sizes": [len(blob) for blob in blobs]}, ensure_ascii=False, separators=(",", ":"))
+        header = zlib.compress(header.encode("utf-8"), 9)
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            f.write(zlib.compress(b"".join(blobs), 9))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"검색 인덱스 파일이 아닙니다: {path}")
+            (size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(zlib.decompress(f.read(size)))
+            data = zlib.decompress(f.read())
+        postings, offset = {}, 0
+        for gram, size in zip(header["grams"], header["sizes"]):
+            postings[gram] = frozenset(_decode(data[offset:offset + size]))
+            offset += size
+        return cls(header["ids"], header["texts"], postings)
+
+def build_index(source, path, university=None):
+    index = SearchIndex.build(read_lectures(source), university)
+    index.save(path)
+    print(f"🔎 검색 인덱스 저장: {path} (강의 {len(index.ids)}개, gram {len(index.postings)}개, {os.path.getsize(path) / 1024:.0f} KB)")
+    return index
+
+def main():
+    parser = argparse.ArgumentParser(description="강의 검색 인덱스 만들기 / 검색")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="결과 파일로 인덱스 만들기")
+    build.add_argument("source", help="결과 파일 (.json / .ndjson / .ndjson.gz)")
+    build.add_argument("-o", "--out", required=True)
+    build.add_argument("--university", choices=["KOREA", "HANYANG"], help="분반 id 규칙 (기본: 파일 이름으로 추측)")
+    query = sub.add_parser("query", help="인덱스로 검색")
+    query.add_argument("index")
+    query.add_argument("keyword")
+    query.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_index(args.source, args.out, args.university or guess_university(args.source))
+        return
+    index = SearchIndex.load(args.index)
+    for lecture_id in index.search(args.keyword, args.limit):
+        name, professor, _ = index.texts[index.ids.index(lecture_id)]
+        print(f"   {lecture_id:<14}{name}  ({professor})")
+
+if __name__ == "__main__":
+    main()
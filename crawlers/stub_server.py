@@ -0,0 +1,63 @@
+import argparse
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from http_fetch import request_key
+
+# ==========================================
+# 🧪 녹화해 둔 포털 응답을 그대로 돌려주는 로컬 스텁 서버
+# ==========================================
+# 1) 실제 포털에서 녹화:  python crawl.py KOREA --http --endpoint korea_endpoint.json --record rec/korea
+# 2) 스텁 서버 실행:      python stub_server.py rec/korea --port 8765
+# 3) 오프라인 재생:       python crawl.py KOREA --http --endpoint korea_endpoint.json \
+#                            --base-url http://127.0.0.1:8765 --queries rec/korea/queries.json
+# 저장소의 fixtures/ 는 실제 녹화가 아니라 손으로 만든 합성 응답 (test_http_replay 참고)
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    record_dir = "."
+
+    def _reply(self, method, params):
+        path = os.path.join(self.record_dir, request_key(method, urlsplit(self.path).path, params) + ".body")
+        if not os.path.exists(path):
+            self.send_error(404, "No recorded response") # 상태줄은 latin-1 이라 한글 사유를 못 씀
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply("GET", dict(parse_qsl(urlsplit(self.path).query, keep_blank_values=True)))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        self._reply("POST", dict(parse_qsl(body, keep_blank_values=True)))
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(record_dir, host="127.0.0.1", port=8765):
+    handler = type("Handler", (ReplayHandler,), {"record_dir": record_dir})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="녹화된 응답 재생용 스텁 서버")
+    parser.add_argument("record_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = make_server(args.record_dir, args.host, args.port)
+    print(f"🧪 스텁 서버 실행 중: http://{args.host}:{args.port} ({args.record_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
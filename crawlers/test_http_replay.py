@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from crawl import parse_args
+from engine import CRAWLERS, run
+from output import ndjson_path, read_ndjson
+from stub_server import make_server
+
+# ==========================================
+# 🧪 녹화 응답 재생 테스트 (네트워크/브라우저 없이)
+# ==========================================
+# fixtures/{korea,hanyang} 은 실제 포털에서 녹화한 게 아니라, 저장소의 결과 JSON 에 있는 강의로 손으로 만든
+# 합성 응답(*.body, --record 와 같은 이름 규칙)과 조회 목록입니다. 포털 응답 모양이 맞는지는 검증 안 됨.
+# endpoint.json 의 url/params 도 실제 요청을 확인하지 않은 추측값이라 녹화 키를 맞추는 용도로만 씀
+# (호스트는 --base-url 로 스텁 서버를 가리킴). 실제 녹화가 생기면 이 폴더를 그걸로 바꿔야 함
+#   - 고려대: 조합 3개 (간호대학 / 공과대학 - MOOC 포함 / 문과대학 - '데이터가 없습니다')
+#   - 한양대: 2페이지 + 포털이 마지막 페이지를 한 번 더 돌려준 3페이지 (여기서 끝나야 함)
+#
+#   python -m unittest test_http_replay
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+class HttpReplayTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = {}
+        for name in ("korea", "hanyang"):
+            server = make_server(os.path.join(FIXTURES, name), port=0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            cls.servers[name] = server
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers.values():
+            server.shutdown()
+            server.server_close()
+
+    def crawl(self, university, *extra):
+        fixture = os.path.join(FIXTURES, university.lower())
+        host, port = self.servers[university.lower()].server_address
+        with tempfile.TemporaryDirectory() as out_dir:
+            output = os.path.join(out_dir, "lectures.json")
+            args = parse_args([university, "--http", "--endpoint", os.path.join(fixture, "endpoint.json"),
+                               "--base-url", f"http://{host}:{port}", "--output", output, *extra])
+            result = run(CRAWLERS[university](args), args)
+            self.assertTrue(result["completed"])
+            with open(output, "r", encoding="utf-8") as f:
+                served = json.load(f)
+            lectures = list(read_ndjson(ndjson_path(output)))
+        # 서버용 JSON 배열은 예전 모양 그대로 (slots/weekMask 는 NDJSON 에만)
+        self.assertEqual(served, [{key: value for key, value in lecture.items() if key not in ("slots", "weekMask")}
+                                  for lecture in lectures])
+        self.assertEqual(result["rows"], len(lectures))
+        return lectures
+
+    def test_korea(self):
+        lectures = self.crawl("KOREA", "--queries", os.path.join(FIXTURES, "korea", "queries.json"))
+        self.assertEqual([lecture["id"] for lecture in lectures],
+                         ["NRSG217-00", "NRSG219-00", "NRSG220-00", "EGRN241-00", "MECH201-01", "MECH201-02"])
+
+        first = lectures[0]
+        self.assertEqual(first["name"], "간호학개론[강의시간] 화 4교시(13:30~14:20)")
+        self.assertEqual(first["professor"], "송준아")
+        self.assertEqual(first["credit"], 1.0)
+        self.assertEqual(first["timeRoom"], "화(4) 우정간호학관 101호")
+        self.assertEqual((first["category"], first["college"], first["department"]), ("전공", "간호대학", "전체"))
+        self.assertEqual(first["slots"], [{"day": "Tue", "start": 810, "end": 860, "room": "우정간호학관 101호"}])
+
+        by_id = {lecture["id"]: lecture for lecture in lectures}
+        self.assertEqual(by_id["NRSG220-00"]["details"], "영강")
+        self.assertEqual(by_id["EGRN241-00"]["details"], "MOOC")
+        self.assertEqual(by_id["EGRN241-00"]["name"], "데이터과학기초") # MOOC 표식(M)은 이름에서 빠짐
+        self.assertEqual(by_id["EGRN241-00"]["slots"], [])
+        self.assertEqual([slot["day"] for slot in by_id["MECH201-01"]["slots"]], ["Tue", "Thu"])
+
+    def test_hanyang(self):
+        lectures = self.crawl("HANYANG")
+        # 3페이지는 2페이지의 반복 → 한 번만 들어가야 함
+        self.assertEqual([lecture["id"] for lecture in lectures],
+                         ["CIE4009", "CIE4034", "CIE4044", "CIE4067", "CIE4067", "CIE4067"])
+        self.assertEqual([lecture["professor"] for lecture in lectures[3:]], ["김영모", "전종수", "김진우"])
+
+        first = lectures[0]
+        self.assertEqual(first["name"], "기초공학")
+        self.assertEqual(first["credit"], 3.0)
+        self.assertEqual(first["timeRoom"], "수(09:00-10:30)\n수(10:30-12:00)")
+        self.assertEqual((first["category"], first["college"], first["department"]), ("전공", "한양대학", "전체"))
+        self.assertEqual(first["slots"], [{"day": "Wed", "start": 540, "end": 720, "room": ""}])
+
+if __name__ == "__main__":
+    unittest.main()
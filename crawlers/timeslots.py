@@ -0,0 +1,97 @@
+import re
+from functools import lru_cache
+
+# ==========================================
+# 🕒 timeRoom 문자열 → 분 단위 시간 슬롯
+# ==========================================
+# 크롤링할 때 한 번만 파싱해서 lecture["slots"] 로 같이 저장합니다 (NDJSON/SQLite/Parquet 에만, 서버용 JSON 배열엔 안 넣음).
+#   고려대: "화(4) 우정간호학관 101호 목(4) 우정간호학관 101호", "수(5-6) L-P 107호"
+#   한양대: "수(09:00-10:30)\n수(10:30-12:00)", "시간미지정강좌"
+# 슬롯 = {"day": "Tue", "start": 810, "end": 885, "room": "우정간호학관 101호"}  (start/end = 00:00부터 흐른 분)
+#
+# 같은 문자열이 분반마다 반복되므로 (고려대 3106행 → 2616종, 한양대 4385행 → 578종) 문자열 단위로 메모이즈합니다.
+
+DAY_MAP = {'월': 'Mon', '화': 'Tue', '수': 'Wed', '목': 'Thu', '금': 'Fri', '토': 'Sat', '일': 'Sun'}
+
+# 고려대 교시표: 1~6교시 75분, 7교시부터 50분 (0교시는 아침 특강)
+KOREA_PERIODS = {
+    0: (480, 530), 1: (540, 615), 2: (630, 705), 3: (720, 795), 4: (810, 885), 5: (900, 975),
+    6: (990, 1065), 7: (1080, 1130), 8: (1140, 1190), 9: (1200, 1250), 10: (1260, 1310), 11: (1320, 1370),
+}
+
+# 요일(교시) / 요일(교시-교시) / 요일(HH:MM-HH:MM)
+SLOT_TOKEN = re.compile(
+    r'([월화수목금토일])\s*\(\s*'
+    r'(?:(\d{1,2}):(\d{2})\s*[-~]\s*(\d{1,2}):(\d{2})'
+    r'|(\d{1,2})(?:\s*-\s*(\d{1,2}))?)'
+    r'\s*\)'
+)
+
+# 고려대 강의명에 붙어 오는 실제 시각: "[강의시간] 화 4~6교시(13:30~17:20)"
+NAME_TIME = re.compile(r'([월화수목금토일])\s*(\d{1,2})(?:\s*[~-]\s*\d{1,2})?교시\s*\((\d{1,2}):(\d{2})\s*~\s*(\d{1,2}):(\d{2})\)')
+
+# 강의명에서 "[강의시간] ..." 꼬리를 떼어냄 → (순수 강의명, 꼬리 문자열 또는 "")
+SCHEDULE_NOTE = re.compile(r'\s*\[강의시간\]')
+
+def split_schedule(name):
+    m = SCHEDULE_NOTE.search(name)
+    if not m:
+        return name, ""
+    return name[:m.start()], name[m.end():].strip()
+
+def period_minutes(university, start_period, end_period):
+    if university == "KOREA":
+        start = KOREA_PERIODS.get(start_period, (540, 600))[0]
+        end = KOREA_PERIODS.get(end_period, (start, start + 50))[1]
+        return start, end
+    # 한양대 등: 1교시 = 09:00, 한 교시 60분 (LectureDataLoader 와 동일)
+    return 540 + (start_period - 1) * 60, 540 + end_period * 60
+
+@lru_cache(maxsize=None)
+def _name_overrides(name):
+    return {(DAY_MAP[m.group(1)], int(m.group(2))): (int(m.group(3)) * 60 + int(m.group(4)), int(m.group(5)) * 60 + int(m.group(6)))
+            for m in NAME_TIME.finditer(name)}
+
+# 캐시 키는 (학교, timeRoom, 강의명 속 시각 정보) → 결과는 바꿀 수 없는 튜플로 보관
+@lru_cache(maxsize=None)
+def _parse(university, time_room, name_times):
+    overrides = dict(name_times)
+    matches = list(SLOT_TOKEN.finditer(time_room))
+    slots = []
+    for index, m in enumerate(matches):
+        day = DAY_MAP[m.group(1)]
+        if m.group(2):
+            start = int(m.group(2)) * 60 + int(m.group(3))
+            end = int(m.group(4)) * 60 + int(m.group(5))
+        else:
+            start_period = int(m.group(6))
+            end_period = int(m.group(7) or start_period)
+            start, end = overrides.get((day, start_period)) or period_minutes(university, start_period, end_period)
+
+        # 강의실 = 이 토큰 끝 ~ 다음 토큰 시작 사이 글자
+        room_end = matches[index + 1].start() if index + 1 < len(matches) else len(time_room)
+        room = time_room[m.end():room_end].strip()
+
+        # 같은 요일·강의실에서 바로 이어지는 슬롯은 하나로 합침 (한양대 09:00-10:30 + 10:30-12:00)
+        if slots and slots[-1][0] == day and slots[-1][2] == start and slots[-1][3] == room:
+            slots[-1] = (day, slots[-1][1], end, room)
+        else:
+            slots.append((day, start, end, room))
+    return tuple(slots)
+
+def parse_slots(time_room, university, name=""):
+    name_times = tuple(sorted(_name_overrides(name).items())) if name and "교시" in name else ()
+    return [{"day": day, "start": start, "end": end, "room": room} for day, start, end, room in _parse(university, time_room or "", name_times)]
+
+# 여러 강의를 한 번에: lecture["slots"] 를 채워서 그대로 돌려줌 (스트리밍으로 써도 됨)
+def normalize_lectures(lectures, university):
+    for lecture in lectures:
+        lecture["slots"] = parse_slots(lecture.get("timeRoom", ""), university, lecture.get("name", ""))
+        yield lecture
+
+def cache_info():
+    return _parse.cache_info()
+
+def clear_cache():
+    _parse.cache_clear()
+    _name_overrides.cache_clear()
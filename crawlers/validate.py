@@ -0,0 +1,196 @@
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import time
+
+from bitmask import DAYS, slots_mask, to_hex
+from output import LectureWriter, guess_university, ndjson_path, ndjson_to_json, read_lectures
+from timeslots import parse_slots, split_schedule
+
+# ==========================================
+# 🧹 크롤링 결과 검증 / 정리 / 중복 제거 (한 번 훑기)
+# ==========================================
+# 강의를 하나씩 흘려보내며 고치고, 이상한 것은 세어서 품질 리포트로 남깁니다.
+#   - 강의명에 붙은 "[강의시간] 화 4교시(13:30~14:20)" → name 에서 떼어 schedule 로
+#   - 예전 한양대 임시 id "HYu-{페이지}-{순번}" (실행마다 바뀜) → 내용 해시로 만든 고정 id
+#   - 가짜 rating 필드 제거
+#   - 학점/시간 범위, 빈 칸, 시간 파싱 실패 확인
+#   - 중복: (id, 내용 해시) 로 판단
+#       고려대 id 는 원래 유일 → 같은 id 가 또 나오면 버림 (내용까지 같으면 duplicate, 다르면 conflicting_id)
+#       한양대 id 는 분반마다 반복 → 내용까지 같은 행만 duplicate 로 표시 (drop_duplicates 면 버림)
+#
+#   python validate.py real_lectures_hanyang_full.json -o cleaned.json
+#   python crawl.py KOREA ... --validate
+
+UNIQUE_IDS = {"KOREA": True, "HANYANG": False}
+SYNTHETIC_ID = re.compile(r"^HYu-\d+-\d+$")
+NO_TIME = {"", "미정", "시간미지정강좌", "집중수업"} # 시간이 없는 게 정상인 표기
+CREDIT_RANGE = (0.0, 20.0)
+TIME_RANGE = (6 * 60, 24 * 60) # 수업 시각으로 말이 되는 범위 (분)
+SAMPLES = 5 # 문제 종류별로 리포트에 남길 예시 수
+
+def quality_path(output_file):
+    base = output_file[:-len(".json")] if output_file.endswith(".json") else output_file
+    return base + ".quality.json"
+
+def _digest(text, size):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=size).hexdigest()
+
+# 학수번호가 없는 행의 id: 실행/페이지 위치와 상관없이 내용이 같으면 같은 id
+def synthetic_id(lecture):
+    parts = [lecture.get(field) or "" for field in ("name", "professor", "timeRoom", "category", "details")]
+    return "HYu-" + _digest("\x1f".join(parts), 5)
+
+# 중복 판단용 내용 해시 (필드 순서와 상관없음)
+def content_hash(lecture):
+    return _digest(json.dumps(lecture, ensure_ascii=False, sort_keys=True, separators=(",", ":")), 8)
+
+class Validator:
+    def __init__(self, university, drop_duplicates=None):
+        self.university = university
+        self.unique_ids = UNIQUE_IDS.get(university, True)
+        self.drop_duplicates = self.unique_ids if drop_duplicates is None else drop_duplicates
+        self.seen = {} # id → 그 id 로 나온 내용 해시들
+        self.issues = {}
+        self.samples = {}
+        self.rows_in = 0
+        self.rows_out = 0
+
+    def flag(self, issue, lecture, detail=None):
+        self.issues[issue] = self.issues.get(issue, 0) + 1
+        examples = self.samples.setdefault(issue, [])
+        if len(examples) < SAMPLES:
+            examples.append({"id": lecture.get("id"), "name": lecture.get("name"), **({"detail": detail} if detail else {})})
+
+    # 고친 강의를 돌려주고, 버릴 행이면 None
+    def check(self, lecture):
+        self.rows_in += 1
+        lecture = {key: value.strip() if isinstance(value, str) else value for key, value in lecture.items()}
+
+        if "rating" in lecture:
+            del lecture["rating"]
+            self.flag("fake_rating", lecture)
+
+        # slots 는 강의명 속 시각 정보까지 보고 만들어야 하므로 이름을 자르기 전에
+        if lecture.get("slots") is None:
+            lecture["slots"] = parse_slots(lecture.get("timeRoom", ""), self.university, lecture.get("name", ""))
+            lecture["weekMask"] = to_hex(slots_mask(lecture["slots"]))
+        name, schedule = split_schedule(lecture.get("name", ""))
+        if schedule:
+            lecture["name"], lecture["schedule"] = name, schedule
+            self.flag("schedule_in_name", lecture, schedule)
+
+        if not lecture.get("id"):
+            self.flag("missing_id", lecture)
+            return None
+        if SYNTHETIC_ID.match(lecture["id"]):
+            lecture["id"] = synthetic_id(lecture)
+            self.flag("synthetic_id", lecture)
+        if not lecture.get("name"):
+            self.flag("missing_name", lecture)
+        if not lecture.get("professor"):
+            self.flag("missing_professor", lecture)
+
+        credit = lecture.get("credit")
+        if not isinstance(credit, (int, float)) or math.isnan(credit) or not CREDIT_RANGE[0] <= credit <= CREDIT_RANGE[1]:
+            self.flag("credit_out_of_range", lecture, credit)
+
+        self._check_slots(lecture)
+
+        digest = content_hash(lecture)
+        hashes = self.seen.setdefault(lecture["id"], set())
+        if digest in hashes:
+            self.flag("duplicate", lecture)
+            if self.drop_duplicates:
+                return None
+        elif hashes and self.unique_ids:
+            self.flag("conflicting_id", lecture)
+            return None
+        hashes.add(digest)
+
+        self.rows_out += 1
+        return lecture
+
+    def _check_slots(self, lecture):
+        slots = lecture["slots"]
+        if not slots and not set(lecture.get("timeRoom", "").split()) <= NO_TIME:
+            self.flag("unparsed_time", lecture, lecture["timeRoom"])
+        for slot in slots:
+            if slot["day"] not in DAYS or not TIME_RANGE[0] <= slot["start"] < slot["end"] <= TIME_RANGE[1]:
+                self.flag("time_out_of_range", lecture, slot)
+                break
+
+    def run(self, lectures):
+        for lecture in lectures:
+            lecture = self.check(lecture)
+            if lecture is not None:
+                yield lecture
+
+    def report(self):
+        return {
+            "university": self.university,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "ids": len(self.seen),
+            "issues": dict(sorted(self.issues.items(), key=lambda item: -item[1])),
+            "samples": self.samples,
+        }
+
+def print_report(report):
+    print(f"🧹 검증: {report['rows_in']}행 → {report['rows_out']}행 (id {report['ids']}개)")
+    for issue, count in report["issues"].items():
+        print(f"   {issue:<22}{count:>6}")
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+# 결과 파일을 검증해서 NDJSON 으로 (dst 가 없으면 원본 NDJSON 을 바꿔치기 → 엔진이 이어서 JSON 변환)
+def validate_file(source, university, dst=None, drop_duplicates=None, compact=False):
+    dst = dst or source
+    validator = Validator(university, drop_duplicates)
+    tmp_path = dst[:-len(".gz")] + ".tmp.gz" if dst.endswith(".gz") else dst + ".tmp"
+    with LectureWriter(tmp_path, compact=compact) as writer:
+        for lecture in validator.run(read_lectures(source)):
+            writer.write(lecture)
+    os.replace(tmp_path, dst)
+    return validator.report()
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과 검증 / 정리 / 중복 제거")
+    parser.add_argument("source", help="결과 파일 (.json / .ndjson / .ndjson.gz)")
+    parser.add_argument("-o", "--out", help="정리한 결과 (.json 이면 서버용 배열, 아니면 NDJSON). 없으면 리포트만")
+    parser.add_argument("--university", choices=sorted(UNIQUE_IDS), help="기본: 파일 이름으로 추측")
+    parser.add_argument("--drop-duplicates", action="store_true", default=None, help="내용까지 같은 중복 행은 항상 버림")
+    parser.add_argument("--report", help="품질 리포트 JSON 경로 (기본: 원본 옆 *.quality.json)")
+    args = parser.parse_args()
+
+    university = args.university or guess_university(args.source)
+    if university is None:
+        parser.error("학교를 알 수 없습니다. --university 를 지정하세요.")
+
+    started = time.perf_counter()
+    if args.out and args.out.endswith(".json"):
+        # 서버용 배열 파일은 NDJSON 을 거쳐서 (crawl.py 출력과 같은 모양)
+        stream_file = ndjson_path(args.out)
+        report = validate_file(args.source, university, stream_file, args.drop_duplicates)
+        ndjson_to_json(stream_file, args.out)
+        os.remove(stream_file)
+    elif args.out:
+        report = validate_file(args.source, university, args.out, args.drop_duplicates)
+    else:
+        validator = Validator(university, args.drop_duplicates)
+        for _ in validator.run(read_lectures(args.source)): pass
+        report = validator.report()
+    report["seconds"] = round(time.perf_counter() - started, 3)
+
+    report_file = args.report or quality_path(args.source)
+    write_report(report, report_file)
+    print_report(report)
+    print(f"   ({report['seconds']:.2f}초, 리포트: {report_file})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import time
+
+# ==========================================
+# ⏱️ 고정 sleep 대신 쓰는 '화면 준비됨' 감지기
+# ==========================================
+# 사용법:
+#   before = snapshot_grid(driver, "#gridLecture > tbody")   # 클릭 직전에 현재 상태 기억
+#   (조회/페이지 버튼 클릭)
+#   wait_for_grid(driver, "#gridLecture > tbody", before)    # 바뀌는 즉시 리턴
+#
+# selector 는 행들을 담고 있는 tbody 를 가리키는 CSS 선택자입니다. (크롬은 :has() 도 지원)
+#
+# 아래 셋 중 하나라도 만족하면 '준비됨'으로 봅니다.
+#   1. tbody 가 통째로 새 요소로 교체됨 (우리가 찍어둔 표식이 사라짐)
+#   2. 행 시그니처(행 수 + 첫/끝 행 텍스트)가 바뀜
+#   3. 결과가 똑같이 다시 그려진 경우 → 진행 중인 XHR 이 0개인 상태가 settle 초 동안 유지됨
+
+# XHR 개수를 세는 훅 (문서마다 한 번만 설치, 프레임 안에서 실행하면 그 프레임 기준)
+_INSTALL_XHR_PROBE = """
+if (!window.__fsProbe) {
+    window.__fsProbe = {pending: 0, last: Date.now()};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var probe = window.__fsProbe;
+        probe.pending += 1;
+        probe.last = Date.now();
+        this.addEventListener('loadend', function () {
+            probe.pending = Math.max(0, probe.pending - 1);
+            probe.last = Date.now();
+        });
+        return send.apply(this, arguments);
+    };
+}
+"""
+
+# 폼 전송/프레임 이동으로 문서가 바뀌면 훅도 같이 사라짐 → 상태를 읽을 때 새 문서에 다시 설치
+# (다 읽힌 문서에서만. 조용한 시간은 다시 설치한 시점부터 셈)
+_REINSTALL_PROBE = "if (document.readyState == 'complete') {" + _INSTALL_XHR_PROBE + "}"
+
+_MARK_GRID = """
+var tbody = document.querySelector(arguments[0]);
+if (tbody) tbody.setAttribute('data-fs-seen', '1');
+"""
+
+# [새 tbody 여부, 행 시그니처, 진행 중인 XHR 수, 마지막 XHR 이후 경과 ms, readyState]
+_GRID_STATE = _REINSTALL_PROBE + """
+var tbody = document.querySelector(arguments[0]);
+var probe = window.__fsProbe;
+var pending = probe ? probe.pending : 0;
+var idleMs = probe ? Date.now() - probe.last : 0;
+if (!tbody) return [false, '', pending, idleMs, document.readyState];
+var rows = tbody.rows;
+var sig = rows.length + '|' +
+    (rows.length ? rows[0].textContent : '') + '|' +
+    (rows.length ? rows[rows.length - 1].textContent : '');
+return [!tbody.hasAttribute('data-fs-seen'), sig, pending, idleMs, document.readyState];
+"""
+
+_NETWORK_STATE = _REINSTALL_PROBE + """
+var probe = window.__fsProbe;
+return [probe ? probe.pending : 0, probe ? Date.now() - probe.last : 0, document.readyState];
+"""
+
+POLL_INTERVAL = 0.05
+
+# 폼 전송으로 프레임 문서가 통째로 바뀌는 중에는 스크립트 실행이 실패할 수 있음 → 다음 폴링에서 재시도
+def _poll(driver, script, *args):
+    try:
+        return driver.execute_script(script, *args)
+    except Exception:
+        return None
+
+# '조용했던 시간' = 마지막 XHR 이후 경과 시간, 단 대기 시작 이전 구간은 치지 않음
+# (클릭 직후 아직 XHR 이 출발하지 않은 순간을 '조용함'으로 오판하지 않기 위해)
+def _quiet_for(idle_ms, started):
+    return min(idle_ms / 1000, time.monotonic() - started)
+
+def install_probe(driver):
+    driver.execute_script(_INSTALL_XHR_PROBE)
+
+# 클릭 직전 호출: XHR 훅 설치 + 현재 tbody 에 표식 + 현재 시그니처 반환
+def snapshot_grid(driver, selector):
+    install_probe(driver)
+    driver.execute_script(_MARK_GRID, selector)
+    return driver.execute_script(_GRID_STATE, selector)[1]
+
+# 그리드가 바뀌면 True, 바뀐 건 없지만 네트워크가 조용해졌으면 False 를 바로 리턴
+# timeout 까지 아무 신호도 없으면 False (호출하는 쪽은 그냥 현재 화면을 파싱하면 됨)
+def wait_for_grid(driver, selector, before, timeout=10, settle=0.3):
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        state = _poll(driver, _GRID_STATE, selector)
+        if state:
+            replaced, sig, pending, idle_ms, ready = state
+            if ready == "complete":
+                if replaced or sig != before:
+                    return True
+                if pending == 0 and _quiet_for(idle_ms, started) >= settle:
+                    return False
+        time.sleep(POLL_INTERVAL)
+    return False
+
+# 드롭다운 변경처럼 '그리드'가 아니라 다른 부분이 갱신될 때: 진행 중인 XHR 이 모두 끝나고 settle 초 지나면 리턴
+# (XHR 훅은 변경 '전에' install_probe 로 미리 설치해 두어야 요청을 놓치지 않음)
+def wait_for_network_idle(driver, timeout=10, settle=0.2):
+    started = time.monotonic()
+    while time.monotonic() - started < timeout:
+        state = _poll(driver, _NETWORK_STATE)
+        if state:
+            pending, idle_ms, ready = state
+            if ready == "complete" and pending == 0 and _quiet_for(idle_ms, started) >= settle:
+                return True
+        time.sleep(POLL_INTERVAL)
+    return False